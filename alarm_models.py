@@ -1,5 +1,5 @@
 from pydantic import BaseModel, PlainSerializer, Field
-from enums import AlarmCondition, ParameterAlarmCode
+from enums import AlarmCondition, ParameterAlarmCode, enum_member
 from datetime import datetime
 from typing import ClassVar, Any, Union, get_args, Type
 from tlp_models.tlp import TLPInstance
@@ -68,7 +68,7 @@ class AlarmTypes:
             return AlarmTypes.NoAlarm(
                 timestamp=timestamp,
                 is_srbx=is_srbx,
-                condition=AlarmCondition(condition)
+                condition=enum_member(AlarmCondition, condition)
             )
 
 
@@ -101,7 +101,7 @@ class AlarmTypes:
             
             # Extract specific alarm code
             alarm_code_int: int = data[5]
-            alarm_code: ParameterAlarmCode = ParameterAlarmCode(alarm_code_int)
+            alarm_code: ParameterAlarmCode = enum_member(ParameterAlarmCode, alarm_code_int)
             
             # Extract raw TLP integers and create TLP instance
             point_type: int = data[6]
@@ -114,14 +114,14 @@ class AlarmTypes:
             )
 
             # Get text description
-            alarm_description: str = struct.unpack('<10s', data[9:19])[0]
+            alarm_description: str = struct.unpack_from('<10s', data, 9)[0]
             
             # Get float value
-            alarm_value: float = struct.unpack('<f', data[19:23])[0]
+            alarm_value: float = struct.unpack_from('<f', data, 19)[0]
 
             return AlarmTypes.ParameterAlarm(
                 is_srbx=is_srbx,
-                condition=AlarmCondition(condition),
+                condition=enum_member(AlarmCondition, condition),
                 timestamp=timestamp,
                 alarm_code=alarm_code,
                 tlp=tlp,
@@ -158,14 +158,14 @@ class AlarmTypes:
             fst_index: int = data[5]
             
             # Get text description 
-            alarm_description: str = struct.unpack('<13s', data[6:19])[0]
+            alarm_description: str = struct.unpack_from('<13s', data, 6)[0]
             
             # Get float value
-            alarm_value: float = struct.unpack('<f', data[19:23])[0]
+            alarm_value: float = struct.unpack_from('<f', data, 19)[0]
             
             return AlarmTypes.FSTAlarm(
                 is_srbx=is_srbx,
-                condition=AlarmCondition(condition),
+                condition=enum_member(AlarmCondition, condition),
                 timestamp=timestamp,
                 fst=fst_index,
                 alarm_description=alarm_description,
@@ -192,11 +192,11 @@ class AlarmTypes:
         def from_binary(cls, timestamp: datetime, is_srbx: bool, condition: bool, data: bytes) -> 'AlarmTypes.UserTextAlarm':
             
             # Get text description
-            alarm_description: str = struct.unpack('<18s', data[5:23])[0]
+            alarm_description: str = struct.unpack_from('<18s', data, 5)[0]
 
             return AlarmTypes.UserTextAlarm(
                 is_srbx=is_srbx,
-                condition=AlarmCondition(condition),
+                condition=enum_member(AlarmCondition, condition),
                 timestamp=timestamp,
                 alarm_description=alarm_description
             )
@@ -224,14 +224,14 @@ class AlarmTypes:
         def from_binary(cls, timestamp: datetime, is_srbx: bool, condition: bool, data: bytes) -> 'AlarmTypes.UserValueAlarm':
             
             # Get text description
-            alarm_description: str = struct.unpack('<14s', data[5:19])[0]
+            alarm_description: str = struct.unpack_from('<14s', data, 5)[0]
 
             # Get float value
-            alarm_value: float = struct.unpack('<f', data[19:23])[0]
+            alarm_value: float = struct.unpack_from('<f', data, 19)[0]
             
             return AlarmTypes.UserValueAlarm(
                 is_srbx=is_srbx,
-                condition=AlarmCondition(condition),
+                condition=enum_member(AlarmCondition, condition),
                 timestamp=timestamp,
                 alarm_description=alarm_description,
                 value=alarm_value
@@ -264,32 +264,41 @@ class AlarmTypes:
         
     @classmethod
     def get_alarm_from_binary(cls, data: bytes) -> AlarmT:
+        """Decode a single 23-byte alarm record. Thin wrapper around get_alarm_from_binary_at."""
+        return cls.get_alarm_from_binary_at(buf=data, offset=0)
 
-        # Unpack type byte into type int and bool flags
-        type_int: int = data[0]
-        bit_array: list[bool] = []
-        for i in range(8):
-            bit: int = (type_int >> i) & 1
-            bit_array.append(bool(bit))
-        is_srbx: bool = bit_array[7]
-        condition: bool = bit_array[6]
-        type_code_int: int = 0
-        for i, bit in enumerate(bit_array[:6]):
-            type_code_int |= (bit << i)
+    @classmethod
+    def get_alarm_from_binary_at(cls, buf: bytes, offset: int) -> AlarmT:
+        """
+        Decode the 23-byte alarm record starting at offset within buf, without copying it out.
+
+        Args:
+            buf (bytes): Buffer containing one or more alarm records (e.g. Opcode 118 response data).
+            offset (int): Index of the first byte of the alarm record within buf.
+
+        Returns:
+            AlarmT: Model instance of relevant Alarm subclass.
+        """
+
+        # Type byte: bit 7 = SRBX, bit 6 = condition, bits 0-5 = alarm type code
+        type_int: int = buf[offset]
+        is_srbx: bool = bool(type_int & 0x80)
+        condition: bool = bool(type_int & 0x40)
+        type_code_int: int = type_int & 0x3F
 
         # Get relevant alarm type subclass
         alarm_type: Type[Alarm] = cls.get_alarm_type_by_code(alarm_type_code=type_code_int)
 
         # Extract the timestamp from the timestamp bytes
-        time_int: int = struct.unpack('<I', data[1:5])[0]
+        time_int: int = struct.unpack_from('<I', buf, offset + 1)[0]
         timestamp: datetime = datetime.fromtimestamp(time_int)
 
-        # Invoke the decode method on the alarm class
+        # Invoke the decode method on the alarm class with a zero-copy view of the record
         event_instance: AlarmTypes.AlarmT = alarm_type.from_binary(
             is_srbx=is_srbx,
             condition=condition,
             timestamp=timestamp, 
-            data=data
+            data=memoryview(buf)[offset:offset + 23]
         )
 
         return event_instance
\ No newline at end of file
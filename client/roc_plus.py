@@ -141,6 +141,11 @@ class ROCPlusClient:
         Internal flag to track if a request to the device is actively being processed.
         """
 
+        self._device_data: Optional[DeviceData] = None
+        """
+        Cached ROC/Host device header for Opcode requests. Built on first request and reused.
+        """
+
         self.logger = logger
         """
         Internal logger instance.
@@ -236,15 +241,17 @@ class ROCPlusClient:
         Returns:
             DeviceData: ROC/Host device header data model.
         """
-        try:
-            return DeviceData(
-                roc_address=self.roc_client_def.roc_address,
-                roc_group=self.roc_client_def.roc_group,
-                host_address=self.roc_client_def.host_address,
-                host_group=self.roc_client_def.host_group
-            )
-        except ValidationError as e:
-            raise ROCConfigError('Failed to validate ROC device data.') from e
+        if self._device_data is None:
+            try:
+                self._device_data = DeviceData(
+                    roc_address=self.roc_client_def.roc_address,
+                    roc_group=self.roc_client_def.roc_group,
+                    host_address=self.roc_client_def.host_address,
+                    host_group=self.roc_client_def.host_group
+                )
+            except ValidationError as e:
+                raise ROCConfigError('Failed to validate ROC device data.') from e
+        return self._device_data
     
 
 
@@ -294,8 +301,9 @@ class ROCPlusClient:
             await self._connection.write_to_stream(request_packet)
             self.logger.debug('Request written successfully. Reading response from stream.')
             response_packet: bytes = await self._connection.read_from_stream()
+            response_timestamp: datetime = datetime.now()
             self.logger.debug('Response read successfully. Decoding binary payload into response object.')
-            response: Response = Response.from_binary(raw_response=response_packet, request_data=request_data)
+            response: Response = Response.from_binary(raw_response=response_packet, request_data=request_data, response_timestamp=response_timestamp)
             self.logger.debug('Response decoded successfully. Returning response object.')
             return response
         except ValidationError as e:
@@ -304,7 +312,7 @@ class ROCPlusClient:
             self._active_request = False
 
 
-    TResp = TypeVar('TResp', bound=BaseModel)
+    TResp = TypeVar('TResp', bound=Union[BaseModel, ReadClockData])
 
     def validate_response(self, response_data: ResponseData, response_data_type: Type[TResp]) -> TResp:
         """
@@ -616,11 +624,15 @@ class ROCPlusClient:
             tlp_values (List[TLPValue]): List of TLPValues.
 
         Returns:
-            List[TLPValue]: List of original TLPValues with tag name attribute populated.
+            List[TLPValue]: Copies of the TLPValues with tag name attribute populated (TLPValues are immutable).
         """
         if self.io_definition._defined:
-            for tlp_value in tlp_values:
-                tlp_value.tag_name = self.io_definition.get_point_definition(tlp_instance=tlp_value).point_tag_id
+            return [
+                tlp_value.model_copy(
+                    update={'tag_name': self.io_definition.get_point_definition(tlp_instance=tlp_value).point_tag_id}
+                )
+                for tlp_value in tlp_values
+            ]
         return tlp_values
 
 
@@ -895,7 +907,7 @@ class ROCPlusClient:
                 # Try to retrieve tag name from I/O Definition
                 mapping_io_def: IOPointDefinition = self.io_definition.get_point_definition(mapping_tlp_def)
                 if mapping_io_def.point_tag_id:
-                    mapping_tlp_def.tag_name = mapping_io_def.point_tag_id
+                    mapping_tlp_def = mapping_tlp_def.model_copy(update={'tag_name': mapping_io_def.point_tag_id})
                 
                 # Create entry definition model instance
                 entry_def = OpcodeTableEntryDefinition(table_index=table_index, data_index=data_index, tlp_definition=mapping_tlp_def)
@@ -966,7 +978,9 @@ class ROCPlusClient:
         else:
             history_log_point: TLPInstance | None = TLPInstance.from_integers(point_type=history_point_tlp[0], logical_number=history_point_tlp[1], parameter=history_point_tlp[2])
             if self.io_definition._defined:
-                history_log_point.tag_name = self.io_definition.get_point_definition(tlp_instance=history_log_point).point_tag_id
+                history_log_point = history_log_point.model_copy(
+                    update={'tag_name': self.io_definition.get_point_definition(tlp_instance=history_log_point).point_tag_id}
+                )
             else:
                 if include_tag_name:
                     tag_name_value: TLPValue = await self.read_tlp(
@@ -976,7 +990,7 @@ class ROCPlusClient:
                             history_log_point.point_type.get_parameter_by_name('POINT_TAG_ID').parameter_number
                         )
                     )
-                    history_log_point.tag_name = tag_name_value.value
+                    history_log_point = history_log_point.model_copy(update={'tag_name': tag_name_value.value})
 
         # Instantiate a point definition
         return HistorySegmentPointConfiguration(
@@ -1,6 +1,16 @@
 from enum import Enum
+from typing import Any, Type, TypeVar
 from roc_data_types import ParameterDataTypes as dt, ROCDataType
 
+E = TypeVar('E', bound=Enum)
+
+
+def enum_member(enum_cls: Type[E], value: Any) -> E:
+    """Enum member for a value, from the enum's value map, falling back to the constructor so unknown values raise ValueError."""
+    member: E | None = enum_cls._value2member_map_.get(value)
+    return member if member is not None else enum_cls(value)
+
+
 class ROCOperatingMode(Enum):
     """ROC Operating Mode"""
     FIRMWARE_UPDATE_MODE = 0
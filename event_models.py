@@ -1,7 +1,7 @@
 from re import M
 from pydantic import BaseModel, field_serializer, Field
 from typing import Type, Tuple, Any, ClassVar, Union, get_args
-from enums import SystemEventTypeEnum, UserEventTypeEnum, EventDataTypeDict
+from enums import SystemEventTypeEnum, UserEventTypeEnum, EventDataTypeDict, enum_member
 from datetime import datetime, timedelta
 from roc_data_types import ROCDataType
 from tlp_models.tlp import TLPInstance, TLPValue
@@ -105,7 +105,7 @@ class EventTypes:
         def from_binary(cls, timestamp: datetime, data: bytes) -> 'EventTypes.ParameterChangeEvent':
             
             # Get Operator ID
-            operator_id: str = struct.unpack('<3s', data[5:8])[0]
+            operator_id: str = struct.unpack_from('<3s', data, 5)[0]
             
             # Get raw TLP integers and create TLP model instance
             point_type: int = data[8]
@@ -122,15 +122,8 @@ class EventTypes:
             data_type: ROCDataType = EventDataTypeDict[data_type_int]
             
             # Extract new value based on data type and create TLP Value instance
-            new_value_bytes: bytes = data[12:12 + data_type.structure.size]
-            new_value_tuple: tuple[Any] = struct.unpack(
-                data_type.structure.format, 
-                new_value_bytes
-            )
-            if len(new_value_tuple) == 1:
-                new_value: Any = new_value_tuple[0]
-            else:
-                new_value: Any = [val for val in new_value_tuple]
+            new_value_tuple: tuple[Any] = data_type.structure.unpack_from(data, 12)
+            new_value: Any = new_value_tuple[0] if data_type.is_scalar else list(new_value_tuple)
             
             new_value_obj: TLPValue = TLPValue.from_tlp_instance(
                 tlp=tlp, 
@@ -143,15 +136,8 @@ class EventTypes:
             if data_type.structure.size > 4:
                 old_value = None
             else:
-                old_value_bytes: bytes = data[16:16 + data_type.structure.size]
-                old_value_tuple: tuple[Any] = struct.unpack(
-                    data_type.structure.format,
-                    old_value_bytes
-                )
-                if len(old_value_tuple) == 1:
-                    old_value: Any = old_value_tuple[0]
-                else:
-                    old_value: Any = [val for val in old_value_tuple]
+                old_value_tuple: tuple[Any] = data_type.structure.unpack_from(data, 16)
+                old_value: Any = old_value_tuple[0] if data_type.is_scalar else list(old_value_tuple)
             
             ## Create timestamp, as this is not provided by the protocol
             old_timestamp: datetime = timestamp - timedelta(seconds=1)
@@ -196,10 +182,10 @@ class EventTypes:
 
             # Get specific system event type from code integer
             system_event_code: int = data[5]
-            system_event_type: SystemEventTypeEnum = SystemEventTypeEnum(system_event_code)
+            system_event_type: SystemEventTypeEnum = enum_member(SystemEventTypeEnum, system_event_code)
             
             # Get text description
-            description: str = struct.unpack('<16s', data[6:22])[0]
+            description: str = struct.unpack_from('<16s', data, 6)[0]
             
             return EventTypes.SystemEvent(
                 timestamp=timestamp,
@@ -235,10 +221,10 @@ class EventTypes:
             fst: int = data[5]
 
             # Get float value
-            value: float = struct.unpack('<f', data[6:10])[0]
+            value: float = struct.unpack_from('<f', data, 6)[0]
 
             # Get text description
-            description: str = struct.unpack('<10s', data[10:20])[0]
+            description: str = struct.unpack_from('<10s', data, 10)[0]
 
             return EventTypes.FSTEvent(
                 timestamp=timestamp,
@@ -273,14 +259,14 @@ class EventTypes:
         def from_binary(cls, timestamp: datetime, data: bytes) -> 'EventTypes.UserEvent':
             
             # Get operator ID
-            operator_id: str = struct.unpack('<3s', data[5:8])[0]
+            operator_id: str = struct.unpack_from('<3s', data, 5)[0]
             
             # Get specific user event type from code integer
             user_event_code: int = data[8]
-            user_event_type: UserEventTypeEnum = UserEventTypeEnum(user_event_code)
+            user_event_type: UserEventTypeEnum = enum_member(UserEventTypeEnum, user_event_code)
 
             # Get text description
-            description: str = struct.unpack('<13s', data[9:22])[0]
+            description: str = struct.unpack_from('<13s', data, 9)[0]
 
             return EventTypes.UserEvent(
                 timestamp=timestamp,
@@ -307,7 +293,7 @@ class EventTypes:
         def from_binary(cls, timestamp: datetime, data: bytes) -> 'EventTypes.PowerLostEvent':
             
             # Get power loss timestamp
-            time_int: int = struct.unpack('<I', data[5:9])[0]
+            time_int: int = struct.unpack_from('<I', data, 5)[0]
             power_timestamp: datetime = datetime.fromtimestamp(time_int)
 
             return EventTypes.PowerLostEvent(
@@ -333,7 +319,7 @@ class EventTypes:
         def from_binary(cls, timestamp: datetime, data: bytes) -> 'EventTypes.ClockSetEvent':
 
             # Get time the ROC800 was set to
-            time_int: int = struct.unpack('<I', data[5:9])[0]
+            time_int: int = struct.unpack_from('<I', data, 5)[0]
             roc_timestamp: datetime = datetime.fromtimestamp(time_int)
 
             return EventTypes.ClockSetEvent(
@@ -368,7 +354,7 @@ class EventTypes:
         def from_binary(cls, timestamp: datetime, data: bytes) -> 'EventTypes.CalibrateVerifyEvent':
 
             # Get Operator ID
-            operator_id: str = struct.unpack('<3s', data[5:8])[0]
+            operator_id: str = struct.unpack_from('<3s', data, 5)[0]
 
             # Get raw TLP integers and create TLP model instance
             point_type: int = data[8]
@@ -381,7 +367,7 @@ class EventTypes:
             )
 
             # Get raw value and create TLP value instance
-            raw_value: float = struct.unpack('<f', data[11:15])[0]
+            raw_value: float = struct.unpack_from('<f', data, 11)[0]
             raw_value_obj: TLPValue = TLPValue.from_tlp_instance(
                 tlp=tlp, 
                 value=raw_value, 
@@ -389,7 +375,7 @@ class EventTypes:
             )
 
             # Get calibrated value and create TLP value instance
-            cal_value: float = struct.unpack('<f', data[15:19])[0]
+            cal_value: float = struct.unpack_from('<f', data, 15)[0]
             cal_value_obj: TLPValue = TLPValue.from_tlp_instance(
                 tlp=tlp,
                 value=raw_value,
@@ -434,15 +420,33 @@ class EventTypes:
         
     @classmethod
     def get_event_from_binary(cls, data: bytes) -> EventT:
+        """Decode a single 22-byte event record. Thin wrapper around get_event_from_binary_at."""
+        return cls.get_event_from_binary_at(buf=data, offset=0)
+
+    @classmethod
+    def get_event_from_binary_at(cls, buf: bytes, offset: int) -> EventT:
+        """
+        Decode the 22-byte event record starting at offset within buf, without copying it out.
+
+        Args:
+            buf (bytes): Buffer containing one or more event records (e.g. Opcode 119 response data).
+            offset (int): Index of the first byte of the event record within buf.
+
+        Returns:
+            EventT: Model instance of relevant Event subclass.
+        """
 
         # Get relevant event type subclass
-        event_type: Type[Event] = cls.get_event_type_by_code(event_type_code=data[0])
+        event_type: Type[Event] = cls.get_event_type_by_code(event_type_code=buf[offset])
 
         # Extract the timestamp from the timestamp bytes
-        time_int: int = struct.unpack('<I', data[1:5])[0]
+        time_int: int = struct.unpack_from('<I', buf, offset + 1)[0]
         timestamp: datetime = datetime.fromtimestamp(time_int)
 
-        # Invoke the decode method on the event class
-        event_instance: EventTypes.EventT = event_type.from_binary(timestamp=timestamp, data=data)
+        # Invoke the decode method on the event class with a zero-copy view of the record
+        event_instance: EventTypes.EventT = event_type.from_binary(
+            timestamp=timestamp, 
+            data=memoryview(buf)[offset:offset + 22]
+        )
 
         return event_instance
\ No newline at end of file
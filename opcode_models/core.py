@@ -1,10 +1,15 @@
 from abc import ABC
 from pydantic import BaseModel, field_serializer, SerializationInfo
 import struct
-from typing import Generic, TypeVar
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
 from .opcodes import DeviceData, RequestData, ResponseData, MessageModel, MessageModels
 
 
+_S_CRC = struct.Struct('<H')
+"""Request CRC trailer (LSB first)."""
+
+
 class CRC(BaseModel):
     """
     Cyclic Redundancy Check (CRC) model.
@@ -62,7 +67,9 @@ class Request(BaseModel, ABC):
 
     def to_binary(self) -> bytes:
         """Full request packet with header, request data, and CRC."""
-        full_packet = self._packet_without_crc + struct.pack('BB', self.crc.lsb, self.crc.msb)
+        # Build the packet and CRC once; CRC is appended LSB first
+        packet_without_crc: bytes = self._packet_without_crc
+        full_packet = packet_without_crc + _S_CRC.pack(CRC(data=packet_without_crc).crc_value)
         return full_packet
 
 T = TypeVar('T', bound=ResponseData)
@@ -74,11 +81,11 @@ class Response(BaseModel, Generic[T]):
     response_data: T
 
     @classmethod
-    def from_binary(cls, raw_response: bytes, request_data: RequestData) -> 'Response':
+    def from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> 'Response':
         device_data: DeviceData = DeviceData.response_from_binary(raw_response=raw_response)
         opcode: int = int(raw_response[4])
         opcode_model: MessageModel = MessageModels.get_model_by_opcode(opcode=opcode)
-        response_data: ResponseData = opcode_model.response_data.from_binary(raw_response=raw_response, request_data=request_data)
+        response_data: ResponseData = opcode_model.response_data.from_binary(raw_response=raw_response, request_data=request_data, response_timestamp=response_timestamp)
         return Response(device_data=device_data, response_data=response_data)
     
     @field_serializer('response_data', when_used='always')
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import ClassVar, Dict
 
 class OpcodeErrorCode(BaseModel):
     """
@@ -50,10 +51,14 @@ class OpcodeErrorCodes:
     _63 = OpcodeErrorCode(error_code=63, error_description='Requested Access Level Too High', cause_byte_description='Access Level')
     _77 = OpcodeErrorCode(error_code=77, error_description='Invalid logoff string', cause_byte_description='Ignored')
 
+    _MAP: ClassVar[Dict[int, OpcodeErrorCode]] = {
+        v.error_code: v for v in list(locals().values()) if isinstance(v, OpcodeErrorCode)
+    }
+    """Error code definitions indexed by numeric error code."""
+
     @staticmethod
     def get_error_code(error_code: int) -> OpcodeErrorCode:
-        error_code_key: str = f'_{error_code}'
-        if hasattr(OpcodeErrorCodes, error_code_key):
-            return getattr(OpcodeErrorCodes, error_code_key)
-        else:
+        try:
+            return OpcodeErrorCodes._MAP[error_code]
+        except KeyError:
             raise KeyError(f'No error code found for provided code: {error_code}')
\ No newline at end of file
@@ -1,16 +1,19 @@
 import opcode
 from typing import Type, List, Optional, Dict, Any, TypeVar, Generic, overload, Union
 import struct
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 from urllib import request
-from numpy import number
-from pydantic import BaseModel, PlainSerializer, Field, RootModel, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PlainSerializer, Field, RootModel, model_validator
 from enum import Enum
 from typing_extensions import Annotated, Self
+from loguru import logger
 from abc import ABC, abstractmethod
 from opcode_models.error_codes import OpcodeErrorCodes, OpcodeErrorCode
 from roc_data_types import ROCDataType
-from tlp_models.tlp import TLPInstance, TLPValue
+from tlp_models.tlp import TLPInstance, TLPValue, _resolve_definitions
 from tlp_models.point_type import PointType
 from tlp_models.point_types import PointTypes
 from tlp_models.parameter import Parameter
@@ -24,12 +27,104 @@ from enums import (
     LogicalCompatibilityStatus,
     HistoryType,
     TransactionDataTypeDict,
-    TransactionHistoryRequestCommand
+    TransactionHistoryRequestCommand,
+    enum_member
 )
 from alarm_models import AlarmTypes
 from event_models import EventTypes
 
+
+
+_I16 = struct.Struct('<h')
+"""Single little-endian signed 16-bit value (e.g. a log or history index)."""
+
+_F32 = struct.Struct('<f')
+"""Single little-endian float value."""
+
+_TLP = struct.Struct('BBB')
+"""Point type, logical number, parameter triplet."""
+
+_U32 = struct.Struct('<I')
+"""Single little-endian unsigned 32-bit value (e.g. a ROC timestamp)."""
+
+
+@lru_cache(maxsize=64)
+def _floats_struct(count: int) -> struct.Struct:
+    """Struct for a run of little-endian floats, cached by count."""
+    return struct.Struct(f'<{count}f')
+
+
+def _unpack_f32(buf: bytes, offset: int, count: int) -> List[float]:
+    """
+    Read count little-endian floats starting at offset within buf.
+
+    numpy.frombuffer wins once the run is long enough to amortise its setup; short runs use a cached Struct.
+    """
+    if count >= 32:
+        return np.frombuffer(buf, dtype='<f4', count=count, offset=offset).tolist()
+    return list(_floats_struct(count).unpack_from(buf, offset))
+
+
+@lru_cache(maxsize=128)
+def _history_grid_struct(number_of_points: int, number_of_periods: int) -> struct.Struct:
+    """Struct for a whole Opcode 136 grid (per period: timestamp + one float per point), cached by grid shape."""
+    return struct.Struct('<' + ('I' + 'f' * number_of_points) * number_of_periods)
+
+
+@lru_cache(maxsize=128)
+def _history_row_struct(number_of_points: int, timestamps: bool) -> struct.Struct:
+    """Struct for one Opcode 139 time period (optional timestamp + one float per point), cached by row shape."""
+    return struct.Struct(('<I' if timestamps else '<') + 'f' * number_of_points)
+
+
+@lru_cache(maxsize=256)
+def _parameter_run_layout(
+    point_type: int,
+    starting_parameter: int,
+    number_of_parameters: int
+) -> tuple[Type[PointType], tuple[tuple[Parameter, int], ...], struct.Struct]:
+    """
+    Decoding layout for a run of consecutive parameters of one point type (Opcode 167), cached by request shape.
+
+    Returns the point type class, a (parameter definition, number of unpacked items) pair per parameter, and one
+        Struct covering the values of the whole run.
+    """
+    point_type_def: Type[PointType] = PointTypes.get_point_type_by_number(point_type=point_type)
+    parameter_defs: List[Parameter] = [
+        point_type_def.get_parameter_by_number(parameter_number=starting_parameter + i) for i in range(number_of_parameters)
+    ]
+    layout: tuple[tuple[Parameter, int], ...] = tuple(
+        (parameter_def, parameter_def.data_type.item_count) for parameter_def in parameter_defs
+    )
+    structure = struct.Struct('<' + ''.join(parameter_def.data_type.format_string for parameter_def in parameter_defs))
+    return point_type_def, layout, structure
+
+
+@lru_cache(maxsize=256)
+def _parameter_list_layout(
+    tlps: tuple[tuple[int, int], ...]
+) -> tuple[tuple[tuple[int, int, Type[PointType], Parameter, int], ...], struct.Struct]:
+    """
+    Decoding layout for an Opcode 180 response to a request for the given (point type, parameter) pairs, cached by request.
+
+    Returns a (point type, parameter, point type class, parameter definition, number of unpacked items) entry per TLP
+        and one Struct covering every TLP triplet and value of the response.
+    """
+    layout: List[tuple[int, int, Type[PointType], Parameter, int]] = []
+    format_string: str = '<'
+    for point_type, parameter in tlps:
+        point_type_def, parameter_def = _resolve_definitions(point_type, parameter)
+        layout.append((point_type, parameter, point_type_def, parameter_def, parameter_def.data_type.item_count))
+        format_string += 'BBB' + parameter_def.data_type.format_string
+    return tuple(layout), struct.Struct(format_string)
+
+
+_S_DEVICE = struct.Struct('BBBB')
+"""Four-byte device header of a response: destination address/group followed by source address/group."""
+
+
 class DeviceData(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     roc_address: int
     """ROC address for the target device."""
@@ -43,33 +138,40 @@ class DeviceData(BaseModel):
     host_group: int = 0
     """Group of requesting device. Defaults to 0."""
 
-    def to_binary_request(self) -> bytes:
-        return struct.pack(
-            'BBBB',
+    @cached_property
+    def _binary_request(self) -> bytes:
+        """Packed request header. The model is frozen, so this is built once per instance."""
+        return bytes((
             self.roc_address,
             self.roc_group,
             self.host_address,
             self.host_group
-        )
+        ))
+
+    def to_binary_request(self) -> bytes:
+        return self._binary_request
 
     @classmethod
     def response_from_binary(cls, raw_response: bytes) -> 'DeviceData':
-        device_bytes: bytes = raw_response[0:4]
-        host_address, host_group, roc_address, roc_group = struct.unpack('BBBB', device_bytes)
-        return DeviceData(
+        host_address, host_group, roc_address, roc_group = _S_DEVICE.unpack_from(raw_response, 0)
+        return DeviceData.model_construct(
             roc_address=roc_address,
             roc_group=roc_group,
             host_address=host_address,
             host_group=host_group
         )
 
+_S_OPCODE_HEADER = struct.Struct('BB')
+"""Request opcode and data length bytes."""
+
+
 class RequestData(BaseModel, ABC):
 
     opcode: int
 
     @property
     def opcode_binary(self) -> bytes:
-        return struct.pack('B', self.opcode)
+        return bytes((self.opcode,))
 
     @property
     @abstractmethod
@@ -81,9 +183,9 @@ class RequestData(BaseModel, ABC):
         return len(self.data_binary)
 
     def to_binary(self) -> bytes:
+        # Build data_binary once; the data_length property would rebuild it
         data_binary: bytes = self.data_binary
-        data_length_binary: bytes = struct.pack('B', self.data_length)
-        return (self.opcode_binary + data_length_binary + data_binary)
+        return _S_OPCODE_HEADER.pack(self.opcode, len(data_binary)) + data_binary
     
 
 
@@ -91,7 +193,7 @@ class EmptyResponseData(BaseModel):
     pass
 
 
-T = TypeVar('T', bound=BaseModel)
+T = TypeVar('T', bound=Union[BaseModel, 'ReadClockData'])
 
 class ResponseData(BaseModel, ABC, Generic[T]):
 
@@ -103,24 +205,26 @@ class ResponseData(BaseModel, ABC, Generic[T]):
 
     @classmethod
     def opcode_from_binary(cls, raw_response: bytes) -> int:
-        return int(raw_response[4])
+        """Opcode byte of a raw response. Kept for callers; from_binary reads the byte directly."""
+        return raw_response[4]
 
     @classmethod
     def data_length_from_binary(cls, raw_response: bytes) -> int:
-        return int(raw_response[5])
+        """Data length byte of a raw response. Kept for callers; from_binary reads the byte directly."""
+        return raw_response[5]
 
     @classmethod
     @abstractmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> T:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> T:
         pass
 
     @classmethod
-    def from_binary(cls, raw_response: bytes, request_data: RequestData) -> 'ResponseData':
-        opcode: int = cls.opcode_from_binary(raw_response=raw_response)
-        data_length: int = cls.data_length_from_binary(raw_response=raw_response)
+    def from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> 'ResponseData':
+        opcode: int = raw_response[4]
+        data_length: int = raw_response[5]
         data: Optional[T] = None
         if data_length > 0:
-            data = cls.data_from_binary(raw_response=raw_response, request_data=request_data)
+            data = cls.data_from_binary(raw_response=raw_response, request_data=request_data, response_timestamp=response_timestamp)
         return cls(
             opcode=opcode,
             data_length=data_length,
@@ -186,6 +290,13 @@ class SystemConfigData(BaseModel):
     """Number of logical points for each point type, indexed by point type ID."""
 
 
+_S_SYSTEM_CONFIG = struct.Struct('<BhBBBB11xB196B')
+"""Opcode 6 response payload: mode, comm port, access mode, compatibility, revision, subtype, (reserved), ROC type, point type 60-255 counts."""
+
+_POINT_TYPE_KEYS: tuple[int, ...] = tuple(range(60, 256))
+"""Point types whose logical point counts are reported by Opcode 6, in payload order."""
+
+
 class SystemConfigResponseData(ResponseData[SystemConfigData]):
     """
     Response data model for System Configuration request.
@@ -194,26 +305,20 @@ class SystemConfigResponseData(ResponseData[SystemConfigData]):
     data: Optional[SystemConfigData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> SystemConfigData:
-        operating_mode: int = int(raw_response[6])
-        comm_port: int = struct.unpack('h', raw_response[7:9])[0]
-        security_access_mode: int = int(raw_response[9])
-        compatibility_status: int = int(raw_response[10])
-        opcode_revision: int = int(raw_response[11])
-        roc_subtype: int = int(raw_response[12])
-        roc_type: int = int(raw_response[24])
-        point_type_counts: Dict[int, int] = {}
-        for i in range(25, 221):
-            point_type: int = i + 35
-            point_type_counts[point_type] = int(raw_response[i])
-        return SystemConfigData(
-            operating_mode=ROCOperatingMode(operating_mode),
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> SystemConfigData:
+        (
+            operating_mode, comm_port, security_access_mode, compatibility_status, 
+            opcode_revision, roc_subtype, roc_type, *counts
+        ) = _S_SYSTEM_CONFIG.unpack_from(raw_response, 6)
+        point_type_counts: Dict[int, int] = dict(zip(_POINT_TYPE_KEYS, counts))
+        return SystemConfigData.model_construct(
+            operating_mode=enum_member(ROCOperatingMode, operating_mode),
             comm_port=comm_port,
             security_access_mode=security_access_mode,
-            compatibility_status=LogicalCompatibilityStatus(compatibility_status),
-            opcode_revision=OpcodeRevision(opcode_revision),
-            roc_subtype=ROCSubType(roc_subtype),
-            roc_type=ROCType(roc_type),
+            compatibility_status=enum_member(LogicalCompatibilityStatus, compatibility_status),
+            opcode_revision=enum_member(OpcodeRevision, opcode_revision),
+            roc_subtype=enum_member(ROCSubType, roc_subtype),
+            roc_type=enum_member(ROCType, roc_type),
             point_type_counts=point_type_counts
         )
 
@@ -232,7 +337,8 @@ class ReadClockRequestData(RequestData):
 
 
 
-class ReadClockData(BaseModel):
+@dataclass(slots=True)
+class ReadClockData:
 
     current_second: int
 
@@ -260,22 +366,17 @@ class ReadClockData(BaseModel):
         )
 
 
+_S_READ_CLOCK = struct.Struct('<BBBBBHB')
+"""Opcode 7 response payload: second, minute, hour, day, month, year, day of week."""
+
+
 class ReadClockResponseData(ResponseData[ReadClockData]):
 
     data: Optional[ReadClockData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> ReadClockData:
-        current_second, current_minute, current_hour, current_day, current_month, current_year, current_day_of_week = struct.unpack('<BBBBBHB', raw_response[6:14])
-        return ReadClockData(
-            current_second=current_second,
-            current_minute=current_minute,
-            current_hour=current_hour,
-            current_day=current_day,
-            current_month=current_month,
-            current_year=current_year,
-            current_day_of_week=current_day_of_week
-        )
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> ReadClockData:
+        return ReadClockData(*_S_READ_CLOCK.unpack_from(raw_response, 6))
     
 
 
@@ -293,12 +394,11 @@ class OpcodeTableRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        return struct.pack(
-            'BBB',
+        return bytes((
             self.table_number,
             self.starting_location,
             self.number_of_locations 
-        )
+        ))
 
 
 class OpcodeTableData(BaseModel):
@@ -314,13 +414,28 @@ class OpcodeTableData(BaseModel):
         data: Any
 
 
+_S_OPCODE_TABLE_HEADER = struct.Struct('<BBBf')
+"""Opcode 10 response header: table number, starting location, number of locations, table version number."""
+
+
 class OpcodeTableResponseData(ResponseData[OpcodeTableData]):
     
     data: Optional[OpcodeTableData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> OpcodeTableData:
-        return super().data_from_binary(raw_response=raw_response, request_data=request_data)
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> OpcodeTableData:
+        data_length: int = raw_response[5]
+        table_number, starting_location, number_of_locations, table_version_number = _S_OPCODE_TABLE_HEADER.unpack_from(raw_response, 6)
+        
+        # Entry data types depend on the table configuration, so the data is returned undecoded
+        data: bytes = raw_response[6 + _S_OPCODE_TABLE_HEADER.size:6 + data_length]
+        return OpcodeTableData.model_construct(
+            table_number=table_number,
+            starting_location=starting_location,
+            number_of_locations=number_of_locations,
+            table_version_number=table_version_number,
+            data=data
+        )
 
 
 
@@ -341,7 +456,7 @@ class IOLocationRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        return struct.pack('B', self.request_type.value)
+        return bytes((self.request_type.value,))
     
 
 class IOLocationData(BaseModel):
@@ -355,13 +470,11 @@ class IOLocationResponseData(ResponseData[IOLocationData]):
     data: Optional[IOLocationData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> IOLocationData:
-        data_length: int = int(raw_response[5])
-        location_data: Dict[int, int] = {}
-        data_bytes: bytes = raw_response[6:6 + data_length]
-        for location, data in enumerate(data_bytes):
-            location_data[location] = data
-        return IOLocationData(location_data=location_data)
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> IOLocationData:
+        data_length: int = raw_response[5]
+        data_bytes: memoryview = memoryview(raw_response)[6:6 + data_length]
+        location_data: Dict[int, int] = dict(enumerate(data_bytes))
+        return IOLocationData.model_construct(location_data=location_data)
 
 
 
@@ -379,12 +492,10 @@ class TodayYestMinMaxRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BB',
+        return bytes((
             self.history_segment,
             self.history_point
-        )
-        return data
+        ))
 
 class TodayYestMinMaxData(BaseModel):
 
@@ -425,6 +536,10 @@ class TodayYestMinMaxData(BaseModel):
     """Value during last completed period."""
 
 
+_S_MINMAX = struct.Struct('<BBBBBBfffBBBBBBBBBBffBBBBBBBBBBf')
+"""Opcode 105 response payload (50 bytes): segment/point/archive/TLP, then values and min/max time stamps."""
+
+
 class TodayYestMinMaxResponseData(ResponseData[TodayYestMinMaxData]):
     """
     Parameter request response data meta-model.
@@ -433,7 +548,7 @@ class TodayYestMinMaxResponseData(ResponseData[TodayYestMinMaxData]):
     data: Optional[TodayYestMinMaxData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> TodayYestMinMaxData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> TodayYestMinMaxData:
         
         def time_tuple_to_datetime(time_tuple: tuple[int, int, int, int, int]) -> datetime:
             return datetime(
@@ -445,25 +560,16 @@ class TodayYestMinMaxResponseData(ResponseData[TodayYestMinMaxData]):
                 second=time_tuple[0]
             )
         
-        # Unpack data
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
-        history_segment: int = response_data[0]
-        history_point: int = response_data[1]
-        history_archive_method: int = response_data[2]
-        point_type: int = response_data[3]
-        logical_number: int = response_data[4]
-        parameter: int = response_data[5]
-        current_value: float = struct.unpack('<f', response_data[6:10])[0]
-        min_today: float = struct.unpack('<f', response_data[10:14])[0]
-        max_today: float = struct.unpack('<f', response_data[14:18])[0]
-        min_today_time_tuple: tuple[int, int, int, int, int] = struct.unpack('BBBBB', response_data[18:23])
-        max_today_time_tuple: tuple[int, int, int, int, int] = struct.unpack('BBBBB', response_data[23:28])
-        min_yesterday: float = struct.unpack('<f', response_data[28:32])[0]
-        max_yesterday: float = struct.unpack('<f', response_data[32:36])[0]
-        min_yest_time_tuple: tuple[int, int, int, int, int] = struct.unpack('BBBBB', response_data[36:41])
-        max_yest_time_tuple: tuple[int, int, int, int, int] = struct.unpack('BBBBB', response_data[41:46])
-        last_value: float = struct.unpack('<f', response_data[46:50])[0]
+        # Unpack the whole fixed-size payload in one call
+        fields: tuple = _S_MINMAX.unpack_from(raw_response, 6)
+        history_segment, history_point, history_archive_method, point_type, logical_number, parameter = fields[0:6]
+        current_value, min_today, max_today = fields[6:9]
+        min_today_time_tuple: tuple[int, int, int, int, int] = fields[9:14]
+        max_today_time_tuple: tuple[int, int, int, int, int] = fields[14:19]
+        min_yesterday, max_yesterday = fields[19:21]
+        min_yest_time_tuple: tuple[int, int, int, int, int] = fields[21:26]
+        max_yest_time_tuple: tuple[int, int, int, int, int] = fields[26:31]
+        last_value: float = fields[31]
         
         # Convert some of the values into tidier objects
         history_tlp: TLPInstance = TLPInstance.from_integers(
@@ -471,39 +577,25 @@ class TodayYestMinMaxResponseData(ResponseData[TodayYestMinMaxData]):
             logical_number=logical_number, 
             parameter=parameter
         )
-        min_today_obj: TLPValue = TLPValue.from_tlp_instance(
-            tlp=history_tlp,
-            value=min_today,
-            timestamp=time_tuple_to_datetime(min_today_time_tuple)
-        )
-        max_today_obj: TLPValue = TLPValue.from_tlp_instance(
+        (
+            current_value_obj, min_today_obj, max_today_obj, 
+            min_yesterday_obj, max_yesterday_obj, last_period_value_obj
+        ) = TLPValue.from_tlp_instance_batch(
             tlp=history_tlp,
-            value=max_today,
-            timestamp=time_tuple_to_datetime(max_today_time_tuple)
-        )
-        min_yesterday_obj: TLPValue = TLPValue.from_tlp_instance(
-            tlp=history_tlp,
-            value=min_yesterday,
-            timestamp=time_tuple_to_datetime(min_yest_time_tuple)
-        )
-        max_yesterday_obj: TLPValue = TLPValue.from_tlp_instance(
-            tlp=history_tlp,
-            value=max_yesterday,
-            timestamp=time_tuple_to_datetime(max_yest_time_tuple)
-        )
-        current_value_obj: TLPValue = TLPValue.from_tlp_instance(
-            tlp=history_tlp,
-            value=current_value
-        )
-        last_period_value_obj: TLPValue = TLPValue.from_tlp_instance(
-            tlp=history_tlp,
-            value=last_value
+            items=[
+                (current_value, None),
+                (min_today, time_tuple_to_datetime(min_today_time_tuple)),
+                (max_today, time_tuple_to_datetime(max_today_time_tuple)),
+                (min_yesterday, time_tuple_to_datetime(min_yest_time_tuple)),
+                (max_yesterday, time_tuple_to_datetime(max_yest_time_tuple)),
+                (last_value, None)
+            ]
         )
 
-        return TodayYestMinMaxData(
+        return TodayYestMinMaxData.model_construct(
             history_segment=history_segment,
             history_point=history_point,
-            history_archive_method=HistoryArchiveType(history_archive_method),
+            history_archive_method=enum_member(HistoryArchiveType, history_archive_method),
             history_point_tlp=history_tlp,
             current_value=current_value_obj,
             min_value_today=min_today_obj,
@@ -528,14 +620,8 @@ class HistoryTagPeriodIndexRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BB',
-            self.history_segment,
-            len(self.history_points)
-        )
-        for point in self.history_points:
-            data += struct.pack('B', point)
-        return data
+        # Every field is a uint8, so build the payload directly instead of concatenating per point
+        return bytes((self.history_segment, len(self.history_points))) + bytes(self.history_points)
 
 
 class HistoryTagPeriodIndexData(BaseModel):
@@ -553,6 +639,10 @@ class HistoryTagPeriodIndexData(BaseModel):
     """Tag names for each of the defined history points, indexed by point number."""
 
 
+_TAG = struct.Struct('<B10s')
+"""Opcode 108 history point record: point number, 10-character tag name."""
+
+
 class HistoryTagPeriodIndexResponseData(ResponseData[HistoryTagPeriodIndexData]):
     """
     Parameter request response data meta-model.
@@ -561,26 +651,20 @@ class HistoryTagPeriodIndexResponseData(ResponseData[HistoryTagPeriodIndexData])
     data: Optional[HistoryTagPeriodIndexData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> HistoryTagPeriodIndexData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> HistoryTagPeriodIndexData:
         
         # Unpack data
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
         history_segment: int = response_data[0]
         number_of_points: int = response_data[1]
-        periodic_index: int = struct.unpack('<h', response_data[2:4])[0]
-
-        # Extract point data iteratively
-        point_data: bytes = response_data[4:]
-        tag_names: Dict[int, str] = {}
-        start_index: int = 0
-        for _ in range(number_of_points):
-            point_number: int = point_data[start_index]
-            tag_name: str = struct.unpack('<10s', point_data[start_index + 1:start_index + 11])[0]
-            tag_names[point_number] = tag_name
-            start_index += 11
-
-        return HistoryTagPeriodIndexData(
+        periodic_index: int = _I16.unpack_from(response_data, 2)[0]
+
+        # Walk the fixed-size point number/tag name records in C
+        point_data: memoryview = response_data[4:4 + _TAG.size * number_of_points]
+        tag_names: Dict[int, str] = {point: tag.rstrip(b'\x00').decode() for point, tag in _TAG.iter_unpack(point_data)}
+
+        return HistoryTagPeriodIndexData.model_construct(
             history_segment=history_segment,
             number_of_history_points=number_of_points,
             periodic_index=periodic_index,
@@ -592,6 +676,12 @@ class HistoryTagPeriodIndexResponseData(ResponseData[HistoryTagPeriodIndexData])
 
 """Opcode 118: Request Alarm Data"""
 
+_S_LOG_REQUEST = struct.Struct('<Bh')
+"""Opcode 118/119 request payload: number of records, starting log index."""
+
+_S_LOG_HEADER = struct.Struct('<Bhh')
+"""Opcode 118/119 response header: number of records, starting log index, current log index."""
+
 class AlarmDataRequestData(RequestData):
 
     opcode: int = 118
@@ -602,15 +692,7 @@ class AlarmDataRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'B',
-            self.number_of_alarms
-        )
-        data += struct.pack(
-            '<h',
-            self.starting_alarm_log_index
-        )
-        return data
+        return _S_LOG_REQUEST.pack(self.number_of_alarms, self.starting_alarm_log_index)
 
 
 class AlarmDataData(BaseModel):
@@ -633,26 +715,22 @@ class AlarmDataResponseData(ResponseData[AlarmDataData]):
     data: Optional[AlarmDataData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> AlarmDataData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> AlarmDataData:
         
         # Unpack data
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
-        number_of_alarms: int = response_data[0]
-        starting_alarm_log_index: int = struct.unpack('<h', response_data[1:3])[0]
-        current_alarm_log_index: int = struct.unpack('<h', response_data[3:5])[0]
-
-        # Extract alarm data iteratively
-        alarm_data: bytes = response_data[5:]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
+        number_of_alarms, starting_alarm_log_index, current_alarm_log_index = _S_LOG_HEADER.unpack_from(response_data, 0)
+
+        # Extract alarm data iteratively, reading each record in place
         alarms: List[AlarmTypes.AlarmT] = []
-        start_index: int = 0
+        offset: int = 5
         for _ in range(number_of_alarms):
-            this_alarm_data: bytes = alarm_data[start_index:start_index + 23]
-            alarm_obj: AlarmTypes.AlarmT = AlarmTypes.get_alarm_from_binary(data=this_alarm_data)
+            alarm_obj: AlarmTypes.AlarmT = AlarmTypes.get_alarm_from_binary_at(buf=response_data, offset=offset)
             alarms.append(alarm_obj)
-            start_index += 23
+            offset += 23
 
-        return AlarmDataData(
+        return AlarmDataData.model_construct(
             number_of_alarms=number_of_alarms,
             starting_alarm_log_index=starting_alarm_log_index,
             current_alarm_log_index=current_alarm_log_index,
@@ -674,15 +752,7 @@ class EventDataRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'B',
-            self.number_of_events
-        )
-        data += struct.pack(
-            '<h', 
-            self.starting_event_log_index
-        )
-        return data
+        return _S_LOG_REQUEST.pack(self.number_of_events, self.starting_event_log_index)
 
 
 
@@ -706,26 +776,22 @@ class EventDataResponseData(ResponseData[EventDataData]):
     data: Optional[EventDataData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> EventDataData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> EventDataData:
         
         # Unpack data
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
-        number_of_events: int = response_data[0]
-        starting_event_log_index: int = struct.unpack('<h', response_data[1:3])[0]
-        current_event_log_index: int = struct.unpack('<h', response_data[3:5])[0]
-
-        # Extract event data iteratively
-        event_data: bytes = response_data[5:]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
+        number_of_events, starting_event_log_index, current_event_log_index = _S_LOG_HEADER.unpack_from(response_data, 0)
+
+        # Extract event data iteratively, reading each record in place
         events: List[EventTypes.EventT] = []
-        start_index: int = 0
+        offset: int = 5
         for _ in range(number_of_events):
-            this_event_data: bytes = event_data[start_index:start_index + 22]
-            event: EventTypes.EventT = EventTypes.get_event_from_binary(data=this_event_data)
+            event: EventTypes.EventT = EventTypes.get_event_from_binary_at(buf=response_data, offset=offset)
             events.append(event)
-            start_index += 22
+            offset += 22
 
-        return EventDataData(
+        return EventDataData.model_construct(
             number_of_events=number_of_events,
             start_event_log_index=starting_event_log_index,
             current_event_log_index=current_event_log_index,
@@ -737,6 +803,15 @@ class EventDataResponseData(ResponseData[EventDataData]):
 
 """Opcode 135: Request Single Point History Data"""
 
+_S_SINGLE_POINT_HISTORY_REQUEST = struct.Struct('<BBBhB')
+"""Opcode 135 request payload: segment, point, history type, starting segment index, number of values."""
+
+_S_SINGLE_POINT_HISTORY_HEADER = struct.Struct('<BBhB')
+"""Opcode 135 response header: segment, point, current segment index, number of values."""
+
+_TIMESTAMP_HISTORY_TYPES: frozenset[HistoryType] = frozenset({HistoryType.DAILY_TIME_STAMPS, HistoryType.PERIODIC_TIME_STAMPS})
+"""History types for which Opcode 135 returns timestamps rather than values."""
+
 class SinglePointHistoryRequestData(RequestData):
 
     opcode: int = 135
@@ -758,21 +833,13 @@ class SinglePointHistoryRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BBB',
+        return _S_SINGLE_POINT_HISTORY_REQUEST.pack(
             self.history_segment,
             self.history_point_number,
-            self.history_type.value
-        )
-        data += struct.pack(
-            '<h', 
-            self.starting_history_segment_index
-        )
-        data += struct.pack(
-            'B',
+            self.history_type.value,
+            self.starting_history_segment_index,
             self.number_of_values
         )
-        return data
 
 
 class SinglePointHistoryData(BaseModel):
@@ -798,37 +865,31 @@ class SinglePointHistoryResponseData(ResponseData[SinglePointHistoryData]):
     data: Optional[SinglePointHistoryData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> SinglePointHistoryData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> SinglePointHistoryData:
         
         if isinstance(request_data, SinglePointHistoryRequestData):
 
             # Parse response for request-specific data
             data_length: int = raw_response[5]
-            response_data: bytes = raw_response[6:6 + data_length]
+            response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
 
             # Extract contextual data
-            history_segment: int = response_data[0]
-            history_point_number: int = response_data[1]
-            current_history_segment_index: int = struct.unpack('<h', response_data[2:4])[0]
-            number_of_values: int = response_data[4]
+            (
+                history_segment, history_point_number, current_history_segment_index, number_of_values
+            ) = _S_SINGLE_POINT_HISTORY_HEADER.unpack_from(response_data, 0)
             
-            # Extract historical values iteratively
-            start_index = 5
-            values: List[float | datetime] = []
-            for _ in range(number_of_values):
-                value_data: bytes = response_data[start_index : start_index + 4]
-                
-                # Parse as datetime if timestamp requested
-                if request_data.history_type in [HistoryType.DAILY_TIME_STAMPS, HistoryType.PERIODIC_TIME_STAMPS]:
-                    time_int = struct.unpack('<I', value_data)[0]
-                    timestamp: datetime = datetime.fromtimestamp(time_int)
-                    values.append(timestamp)
-                # Parse as float if value requested
-                else:
-                    values.append(struct.unpack('<f', response_data[start_index:start_index + 4])[0])
-                start_index += 4
+            # Extract historical values in a single pass over the fixed-stride value block
+            value_data: memoryview = response_data[5:5 + 4 * number_of_values]
+            values: List[float | datetime]
             
-            return SinglePointHistoryData(
+            # Parse as datetime if timestamp requested
+            if request_data.history_type in _TIMESTAMP_HISTORY_TYPES:
+                values = [datetime.fromtimestamp(time_int) for (time_int,) in _U32.iter_unpack(value_data)]
+            # Parse as float if value requested
+            else:
+                values = _unpack_f32(value_data, 0, number_of_values)
+            
+            return SinglePointHistoryData.model_construct(
                 history_segment=history_segment,
                 history_point_number=history_point_number,
                 current_history_segment_index=current_history_segment_index,
@@ -844,6 +905,12 @@ class SinglePointHistoryResponseData(ResponseData[SinglePointHistoryData]):
 
 """Opcode 136: Request Multiple History Point Data"""
 
+_S_MULTIPLE_POINT_HISTORY_REQUEST = struct.Struct('<BhBBBB')
+"""Opcode 136 request payload: segment, segment index, history type, starting point, number of points, number of periods."""
+
+_S_MULTIPLE_POINT_HISTORY_HEADER = struct.Struct('<BhhB')
+"""Opcode 136 response header: segment, segment index, current segment index, number of data elements."""
+
 class MultiplePointHistoryRequestData(RequestData):
 
     opcode: int = 136
@@ -868,22 +935,14 @@ class MultiplePointHistoryRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'B',
+        return _S_MULTIPLE_POINT_HISTORY_REQUEST.pack(
             self.history_segment,
-        )
-        data += struct.pack(
-            '<h', 
-            self.history_segment_index
-        )
-        data += struct.pack(
-            'BBBB',
+            self.history_segment_index,
             self.history_type.value,
             self.starting_history_point,
             self.number_of_history_points,
             self.number_of_time_periods
         )
-        return data
 
 
 
@@ -911,56 +970,29 @@ class MultiplePointHistoryResponseData(ResponseData[MultiplePointHistoryData]):
     data: Optional[MultiplePointHistoryData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> MultiplePointHistoryData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> MultiplePointHistoryData:
         if isinstance(request_data, MultiplePointHistoryRequestData):
 
             # Parse response for request-specific data
             data_length: int = raw_response[5]
-            response_data: bytes = raw_response[6:6 + data_length]
+            response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
 
             # Extract contextual data
-            history_segment: int = response_data[0]
-            history_segment_index: int = struct.unpack('<h', response_data[1:3])[0]
-            current_history_segment_index: int = struct.unpack('<h', response_data[3:5])[0]
-            number_of_data_elements: int = response_data[5]
+            (
+                history_segment, history_segment_index, current_history_segment_index, number_of_data_elements
+            ) = _S_MULTIPLE_POINT_HISTORY_HEADER.unpack_from(response_data, 0)
 
-            # Calculate the start/end index of each time period
+            # Each time period is one fixed-size row: timestamp followed by one float per point
             number_of_points: int = request_data.number_of_history_points
             number_of_periods: int = request_data.number_of_time_periods
-            start_indexes: list[int] = []
-            curr_index: int = 0
-            for _ in range(number_of_periods):
-                start_indexes.append(curr_index)
-                curr_index += (number_of_points + 1) * 4 # Number of point entries + 1 entry for the time period (all 4 bytes)
-
-            # Extract the point/timestamp data
-            points_data: bytes = response_data[6:]
-            points_length: int = 4 * number_of_points
+            grid: tuple[int | float, ...] = _history_grid_struct(number_of_points, number_of_periods).unpack_from(response_data, 6)
+            row_length: int = number_of_points + 1
+            point_numbers: range = range(request_data.starting_history_point, request_data.starting_history_point + number_of_points)
             values: Dict[datetime, Dict[int, float]] = {}
-            for index in start_indexes:
-
-                # Get timestamp and initialize entry in dictionary
-                timestamp_start_index: int = index
-                timestamp_end_index: int = timestamp_start_index + 4
-                time_int: int = struct.unpack('<I', points_data[timestamp_start_index : timestamp_end_index])[0]
-                timestamp: datetime = datetime.fromtimestamp(time_int)
-                values[timestamp] = {}
-
-                # Extract each point for the timestamp and add to dictionary
-                points_start_index: int = index + 4
-                points_end_index: int = points_start_index + points_length
-                points_bytes: bytes = points_data[points_start_index : points_end_index]
-                points_index: int = 0
-                for i in range(number_of_points):
-                    point_start_index: int = points_index
-                    point_end_index: int = point_start_index + 4
-                    point_bytes: bytes = points_bytes[point_start_index : point_end_index]
-                    point_float: float = struct.unpack('<f', point_bytes)[0]
-                    point_number: int = request_data.starting_history_point + i
-                    values[timestamp][point_number] = point_float
-                    points_index += 4
+            for row_start in range(0, len(grid), row_length):
+                values[datetime.fromtimestamp(grid[row_start])] = dict(zip(point_numbers, grid[row_start + 1:row_start + row_length]))
             
-            return MultiplePointHistoryData(
+            return MultiplePointHistoryData.model_construct(
                 history_segment=history_segment,
                 history_segment_index=history_segment_index,
                 current_history_segment_index=current_history_segment_index,
@@ -975,6 +1007,9 @@ class MultiplePointHistoryResponseData(ResponseData[MultiplePointHistoryData]):
 
 """Opcode 137: Request History Index for a Day"""
 
+_S_DAILY_HISTORY_INDEX = struct.Struct('<Bhhhh')
+"""Opcode 137 response: segment, starting periodic index, periodic entries, daily index, daily entries."""
+
 class DailyHistoryIndexRequestData(RequestData):
 
     opcode: int = 137
@@ -990,13 +1025,11 @@ class DailyHistoryIndexRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BBB',
+        return bytes((
             self.history_segment,
             self.day_requested,
             self.month_requested
-        )
-        return data
+        ))
 
 
 class DailyHistoryIndexData(BaseModel):
@@ -1022,20 +1055,22 @@ class DailyHistoryIndexResponseData(ResponseData[DailyHistoryIndexData]):
     data: Optional[DailyHistoryIndexData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> DailyHistoryIndexData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> DailyHistoryIndexData:
 
         # Parse response for request-specific data
         data_length: int = raw_response[5]
-        response_data: bytes = raw_response[6:6 + data_length]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
 
         # Extract data
-        history_segment: int = response_data[0]
-        starting_periodic_index: int = struct.unpack('<h', response_data[1:3])[0]
-        number_of_periodic_entries: int = struct.unpack('<h', response_data[3:5])[0]
-        daily_index: int = struct.unpack('<h', response_data[5:7])[0]
-        number_of_daily_entries: int = struct.unpack('<h', response_data[7:9])[0]
-
-        return DailyHistoryIndexData(
+        (
+            history_segment,
+            starting_periodic_index,
+            number_of_periodic_entries,
+            daily_index,
+            number_of_daily_entries
+        ) = _S_DAILY_HISTORY_INDEX.unpack_from(response_data, 0)
+
+        return DailyHistoryIndexData.model_construct(
             history_segment=history_segment,
             starting_periodic_index=starting_periodic_index,
             number_of_periodic_entries=number_of_periodic_entries,
@@ -1048,6 +1083,9 @@ class DailyHistoryIndexResponseData(ResponseData[DailyHistoryIndexData]):
 
 """Opcode 138: Request Daily and Periodic History for a Day"""
 
+_S_DAILY_PERIODIC_HISTORY_HEADER = struct.Struct('<BBBBhh')
+"""Opcode 138 response header: segment, point, day, month, periodic entries, daily entries."""
+
 class DailyPeriodicHistoryRequestData(RequestData):
     
     opcode: int = 138
@@ -1066,14 +1104,12 @@ class DailyPeriodicHistoryRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BBBB',
+        return bytes((
             self.history_segment,
             self.history_point,
             self.day_requested,
             self.month_requested
-        )
-        return data
+        ))
     
 
 class DailyPeriodicHistoryData(BaseModel):
@@ -1096,11 +1132,11 @@ class DailyPeriodicHistoryData(BaseModel):
     number_of_daily_entries: int
     """Number of daily entries returned."""
 
-    periodic_values: Dict[int, float]
-    """Periodic historical values indexed by period."""
+    periodic_values: List[float]
+    """Periodic historical values, in period order."""
 
-    daily_values: Dict[int, float]
-    """Daily historical values indexed by day."""
+    daily_values: List[float]
+    """Daily historical values, in day order."""
 
 
 class DailyPeriodicHistoryResponseData(ResponseData[DailyPeriodicHistoryData]):
@@ -1108,35 +1144,28 @@ class DailyPeriodicHistoryResponseData(ResponseData[DailyPeriodicHistoryData]):
     data: Optional[DailyPeriodicHistoryData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> DailyPeriodicHistoryData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> DailyPeriodicHistoryData:
 
         # Parse response for request-specific data
         data_length: int = raw_response[5]
-        response_data: bytes = raw_response[6:6 + data_length]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
 
         # Extract contextual data
-        history_segment: int = response_data[0]
-        history_point: int = response_data[1]
-        day_requested: int = response_data[2]
-        month_requested: int = response_data[3]
-        number_of_periodic_entries: int = struct.unpack('<h', response_data[4:6])[0]
-        number_of_daily_entries: int = struct.unpack('<h', response_data[6:8])[0]
-
-        # Extract value data iteratively
-        periodic_values: Dict[int, float] = {}
-        start_index: int = 0
-        for i in range(number_of_periodic_entries):
-            value: float = struct.unpack('<f', response_data[start_index : start_index + 4])[0]
-            periodic_values[i] = value
-            start_index += 4
+        (
+            history_segment,
+            history_point,
+            day_requested,
+            month_requested,
+            number_of_periodic_entries,
+            number_of_daily_entries
+        ) = _S_DAILY_PERIODIC_HISTORY_HEADER.unpack_from(response_data, 0)
+
+        # Extract each block of values in a single unpack; values start after the 8-byte header
+        periodic_values: List[float] = _unpack_f32(response_data, 8, number_of_periodic_entries)
+        daily_start_index: int = 8 + 4 * number_of_periodic_entries
+        daily_values: List[float] = _unpack_f32(response_data, daily_start_index, number_of_daily_entries)
         
-        daily_values: Dict[int, float] = {}
-        for i in range(number_of_daily_entries):
-            value: float = struct.unpack('<f', response_data[start_index : start_index + 4])[0]
-            daily_values[i] = value
-            start_index += 4
-        
-        return DailyPeriodicHistoryData(
+        return DailyPeriodicHistoryData.model_construct(
             history_segment=history_segment,
             history_point=history_point,
             day_requested=day_requested,
@@ -1152,6 +1181,12 @@ class DailyPeriodicHistoryResponseData(ResponseData[DailyPeriodicHistoryData]):
 
 """Opcode 139: History Information Data"""
 
+_S_HISTORY_INFORMATION_REQUEST = struct.Struct('<BBhBBBB')
+"""Opcode 139 command 1 request header: command, segment, segment index, history type, periods, timestamps flag, number of points."""
+
+_S_HISTORY_INFORMATION_HEADER = struct.Struct('<BhBBB')
+"""Opcode 139 command 1 response header after the command byte: segment, current index, periods, timestamps flag, number of points."""
+
 
 class HistoryInformationRequestData(RequestData):
 
@@ -1188,31 +1223,20 @@ class HistoryInformationRequestData(RequestData):
             ) and (
                 self.history_points
             ):
-                data: bytes = struct.pack(
-                    'BB',
+                header: bytes = _S_HISTORY_INFORMATION_REQUEST.pack(
                     self.command.value,
-                    self.history_segment
-                )
-                data += struct.pack('<h', self.history_segment_index)
-                data += struct.pack(
-                    'BBBB',
+                    self.history_segment,
+                    self.history_segment_index,
                     self.history_type.value,
                     self.number_of_time_periods,
                     int(self.request_timestamps),
                     len(self.history_points)
                 )
-                for point in self.history_points:
-                    data += struct.pack('B', point)
-                return data
+                return header + bytes(self.history_points)
             else:
                 raise TypeError('If requesting point data, must include list of history points, history type, and timestamp request arguments.')
         elif self.command == HistoryInformationRequestCommand.REQUEST_CONFIGURED_POINTS:
-            data: bytes = struct.pack(
-                'BB',
-                self.command.value,
-                self.history_segment
-            )
-            return data
+            return bytes((self.command.value, self.history_segment))
         else:
             raise TypeError
 
@@ -1286,23 +1310,21 @@ class HistoryInformationResponseData(ResponseData[HistoryInformationData]):
     data: Optional[HistoryInformationData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> HistoryInformationData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> HistoryInformationData:
         # Set timestamp of response receipt
-        response_timestamp: datetime = datetime.now()
+        response_timestamp = response_timestamp or datetime.now()
         
         # Parse response for TL, parameter count, and starting parameter
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
         
         # Determine which set of data to return based on command
         command = HistoryInformationRequestCommand(response_data[0])
         if command == HistoryInformationRequestCommand.REQUEST_CONFIGURED_POINTS:
             history_segment: int = response_data[1]
             number_of_configured_points: int = response_data[2]
-            configured_points: list[int] = []
-            for i in range(3, len(response_data)):
-                configured_points.append(response_data[i])
-            return HistoryInformationData(
+            configured_points: list[int] = list(response_data[3:])
+            return HistoryInformationData.model_construct(
                 command=command,
                 history_segment=history_segment,
                 number_of_configured_points=number_of_configured_points,
@@ -1319,46 +1341,31 @@ class HistoryInformationResponseData(ResponseData[HistoryInformationData]):
                 raise TypeError('Invalid type for request data.')
             
             # Unpack basic data
-            history_segment: int = response_data[1]
-            current_index: int = struct.unpack('h', response_data[2:4])[0]
-            number_of_time_periods: int = response_data[4]
-            request_timestamps: bool = bool(response_data[5])
-            number_of_points: int = response_data[6]
-            point_data_bytes: bytes = response_data[7:]
+            (
+                history_segment,
+                current_index,
+                number_of_time_periods,
+                request_timestamps_flag,
+                number_of_points
+            ) = _S_HISTORY_INFORMATION_HEADER.unpack_from(response_data, 1)
+            request_timestamps: bool = request_timestamps_flag != 0
             
-            # Unpack history point values with or without timestamps
-            values: Dict[datetime | int, Dict[int, float]] = {}
-            curr_idx: int = 0
-
             # Quick check to make sure we have expected number of points
             if number_of_points != len(requested_points):
                 raise ValueError('Received different number of points than requested points.')
             
-            # Each time period batch contains the timestamp and then a value for each point
-            for i in range(number_of_time_periods):
-                
-                # Handle timestamps if requested
-                timestamp: datetime | None = None
+            # Each time period row holds the optional timestamp and then a value for each point; rows start at byte 7
+            row_struct: struct.Struct = _history_row_struct(number_of_points, request_timestamps)
+            row_bytes: memoryview = response_data[7:7 + row_struct.size * number_of_time_periods]
+            values: Dict[datetime | int, Dict[int, float]] = {}
+            for i, row in enumerate(row_struct.iter_unpack(row_bytes)):
+                # Key by timestamp if requested, otherwise by time period index
                 if request_timestamps:
-                    time_int: int = struct.unpack('<I', point_data_bytes[curr_idx:curr_idx + 4])[0] # timestamp is 4 bytes
-                    timestamp = datetime.fromtimestamp(time_int)
-                    curr_idx += 4
-                    values[timestamp] = {} # create entry for this timestamp
+                    values[datetime.fromtimestamp(row[0])] = dict(zip(requested_points, row[1:]))
                 else:
-                    values[i] = {} # create entry for time period index
-                
-                for point in requested_points:
-                    point_value: float = struct.unpack('<f', point_data_bytes[curr_idx:curr_idx + 4])[0] # point data is 4 bytes
-                    if request_timestamps:
-                        if timestamp:
-                            values[timestamp][point] = point_value # store at timestamp key
-                        else:
-                            raise ValueError('Timestamps requested but invalid timestamp found.')
-                    else:
-                        values[i][point] = point_value # store at integer time period key
-                    curr_idx += 4 # increment by the 4 value bytes
-
-            return HistoryInformationData(
+                    values[i] = dict(zip(requested_points, row))
+
+            return HistoryInformationData.model_construct(
                 command=command,
                 history_segment=history_segment,
                 current_index=current_index,
@@ -1397,14 +1404,12 @@ class SinglePointParameterRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack(
-            'BBBB',
+        return bytes((
             self.point_type,
             self.logical_number,
             self.number_of_parameters,
             self.starting_parameter_number
-        )
-        return data
+        ))
 
 
 class SinglePointParameterData(BaseModel):
@@ -1433,51 +1438,39 @@ class SinglePointParameterResponseData(ResponseData[SinglePointParameterData]):
     data: Optional[SinglePointParameterData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> SinglePointParameterData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> SinglePointParameterData:
         # Set timestamp of response receipt
-        response_timestamp: datetime = datetime.now()
+        response_timestamp = response_timestamp or datetime.now()
         
         # Parse response for TL, parameter count, and starting parameter
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
         point_type: int = response_data[0]
         logical_number: int = response_data[1]
         number_of_parameters: int = response_data[2]
         starting_parameter_number: int = response_data[3]
         
-        # Remaining data is parameter data
-        data_bytes: bytes = response_data[4:]
-        
-        # Grab PointType class for getting parameter definitions
-        point_type_def: Type[PointType] = PointTypes.get_point_type_by_number(point_type=point_type)
+        # Grab PointType class, parameter definitions and a Struct covering every parameter value
+        point_type_def, layout, structure = _parameter_run_layout(point_type, starting_parameter_number, number_of_parameters)
 
-        # Unpack each parameter value according to its data type
-        start_idx = 0
+        # Unpack all parameter values at once (parameter data starts at byte 4), then split them per parameter
+        value_tuple: tuple[Any, ...] = structure.unpack_from(response_data, 4)
+        logger.trace('Opcode 167: format={}, value_tuple={}', structure.format, value_tuple)
+        item_idx: int = 0
         values: List[TLPValue] = []
-        for i in range(number_of_parameters):
-            parameter_number: int = starting_parameter_number + i
-            parameter_def: Parameter = point_type_def.get_parameter_by_number(parameter_number=parameter_number)
-            end_idx: int = start_idx + parameter_def.data_type.structure.size
-            value_tuple: tuple[Any] = struct.unpack(
-                parameter_def.data_type.structure.format, 
-                data_bytes[start_idx:end_idx]
-            )
-            print(f'Opcode 167: raw_bytes={data_bytes[start_idx:end_idx]}, start_idx={start_idx}, end_idx={end_idx}, format={parameter_def.data_type.structure.format}, size={parameter_def.data_type.structure.size}, value_tuple={value_tuple}')
-            if len(value_tuple) == 1:
-                value: Any = value_tuple[0]
-            else:
-                value: Any = [val for val in value_tuple]
+        for parameter_def, item_count in layout:
+            value: Any = value_tuple[item_idx] if parameter_def.is_scalar else list(value_tuple[item_idx:item_idx + item_count])
+            item_idx += item_count
             values.append(
-                TLPValue(
-                    parameter=parameter_def,
+                TLPValue.from_raw_fast(
                     point_type=point_type_def,
                     logical_number=logical_number,
+                    parameter=parameter_def,
                     value=value,
                     timestamp=response_timestamp
                 )
             )
-            start_idx: int = end_idx
-        return SinglePointParameterData(
+        return SinglePointParameterData.model_construct(
             point_type=point_type,
             logical_number=logical_number,
             number_of_parameters=number_of_parameters,
@@ -1498,15 +1491,15 @@ class ParameterRequestData(RequestData):
 
     @property
     def data_binary(self) -> bytes:
-        data: bytes = struct.pack('B', len(self.tlps))
+        # All fields are uint8; grow a bytearray in place rather than concatenating bytes per TLP
+        data: bytearray = bytearray((len(self.tlps),))
         for tlp in self.tlps:
-            data += struct.pack(
-                'BBB',
+            data.extend((
                 tlp.point_type.point_type_number,
                 tlp.logical_number,
                 tlp.parameter.parameter_number
-            )
-        return data
+            ))
+        return bytes(data)
 
 
 
@@ -1530,49 +1523,94 @@ class ParameterResponseData(ResponseData[ParameterData]):
     data: Optional[ParameterData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> ParameterData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> ParameterData:
         # Set timestamp of response receipt
-        response_timestamp: datetime = datetime.now()
+        response_timestamp = response_timestamp or datetime.now()
         
         # Parse response for parameter count and value data
-        data_length: int = int(raw_response[5])
-        response_data = raw_response[6:6 + data_length]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
         value_count: int = response_data[0]
-        parameter_bytes: bytes = response_data[1:]
         
-        # Unpack each parameter value according to its data type
-        start_idx = 0
+        # The request lists the TLPs up front, so the whole response can usually be read with one cached Struct
+        if isinstance(request_data, ParameterRequestData):
+            parameter_data: Optional[ParameterData] = cls._data_from_requested_layout(
+                response_data, request_data, value_count, response_timestamp
+            )
+            if parameter_data is not None:
+                return parameter_data
+
+        # Unpack each parameter value according to its data type; parameter data starts at byte 1
+        start_idx: int = 1
         values: List[TLPValue] = []
         for _ in range(value_count):
             # Grab TLP data from first 3 bytes
-            tlp_data: bytes = parameter_bytes[start_idx:start_idx + 3]
-            point_type, point_number, param_number = struct.unpack('BBB', tlp_data)
-            point_type_def: Type[PointType] = PointTypes.get_point_type_by_number(point_type=point_type)
-            parameter_def: Parameter = point_type_def.get_parameter_by_number(parameter_number=param_number)
+            point_type, point_number, param_number = _TLP.unpack_from(response_data, start_idx)
+            point_type_def, parameter_def = _resolve_definitions(point_type, param_number)
             
             # Grab value data from remaining bytes, determined by data type
             param_data_start_idx: int = start_idx + 3
-            end_idx: int = param_data_start_idx + parameter_def.data_type.structure.size
-            value_tuple: tuple[Any] = struct.unpack(
-                parameter_def.data_type.structure.format, 
-                parameter_bytes[param_data_start_idx:end_idx]
-            )
-            print(f'Opcode 180: raw_bytes={parameter_bytes[param_data_start_idx:end_idx]}, start_idx={param_data_start_idx}, end_idx={end_idx}, format={parameter_def.data_type.structure.format}, size={parameter_def.data_type.structure.size}, value_tuple={value_tuple}')
-            if len(value_tuple) == 1:
-                value: Any = value_tuple[0]
-            else:
-                value: Any = [val for val in value_tuple]
+            structure: struct.Struct = parameter_def.data_type.structure
+            end_idx: int = param_data_start_idx + structure.size
+            value_tuple: tuple[Any, ...] = structure.unpack_from(response_data, param_data_start_idx)
+            logger.trace('Opcode 180: start_idx={}, end_idx={}, format={}, value_tuple={}', param_data_start_idx, end_idx, structure.format, value_tuple)
+            value: Any = value_tuple[0] if parameter_def.is_scalar else list(value_tuple)
             values.append(
-                TLPValue(
+                TLPValue.from_raw_fast(
+                    point_type=point_type_def,
+                    logical_number=point_number,
                     parameter=parameter_def,
+                    value=value,
+                    timestamp=response_timestamp
+                )
+            )
+            start_idx = end_idx
+        return ParameterData.model_construct(
+            values=values,
+            value_count=value_count
+        )
+
+    @staticmethod
+    def _data_from_requested_layout(
+        response_data: memoryview,
+        request_data: ParameterRequestData,
+        value_count: int,
+        response_timestamp: datetime
+    ) -> Optional[ParameterData]:
+        """
+        Decode the response with one Struct built from the requested TLPs.
+
+        Returns None if the response does not match the request (different count, too short, or a TLP that was not
+            requested), in which case the caller decodes TLP by TLP.
+        """
+        if len(request_data.tlps) != value_count:
+            return None
+        layout, structure = _parameter_list_layout(tuple(
+            (tlp.point_type.point_type_number, tlp.parameter.parameter_number) for tlp in request_data.tlps
+        ))
+        if 1 + structure.size > len(response_data):
+            return None
+        value_tuple: tuple[Any, ...] = structure.unpack_from(response_data, 1)
+        logger.trace('Opcode 180: format={}, value_tuple={}', structure.format, value_tuple)
+        item_idx: int = 0
+        values: List[TLPValue] = []
+        for point_type, param_number, point_type_def, parameter_def, item_count in layout:
+            if value_tuple[item_idx] != point_type or value_tuple[item_idx + 2] != param_number:
+                return None
+            point_number: int = value_tuple[item_idx + 1]
+            item_idx += 3
+            value: Any = value_tuple[item_idx] if parameter_def.is_scalar else list(value_tuple[item_idx:item_idx + item_count])
+            item_idx += item_count
+            values.append(
+                TLPValue.from_raw_fast(
                     point_type=point_type_def,
                     logical_number=point_number,
+                    parameter=parameter_def,
                     value=value,
                     timestamp=response_timestamp
                 )
             )
-            start_idx: int = end_idx
-        return ParameterData(
+        return ParameterData.model_construct(
             values=values,
             value_count=value_count
         )
@@ -1581,6 +1619,23 @@ class ParameterResponseData(ResponseData[ParameterData]):
 
 """Opcode 206: Read Transaction History Data"""
 
+_S_TRANSACTION_LIST_REQUEST = struct.Struct('<BBh')
+"""Opcode 206 command 1 request: command, segment, transaction offset."""
+
+_S_READ_TRANSACTION_REQUEST = struct.Struct('<BBhh')
+"""Opcode 206 command 2 request: command, segment, transaction number, data offset."""
+
+_S_TRANSACTION_LIST_HEADER = struct.Struct('<BB10sh')
+"""Opcode 206 command 1 response header after the command byte: transaction count, more data flag, description, payload size."""
+
+_S_TRANSACTION = struct.Struct('<hI')
+"""Opcode 206 command 1 transaction entry: transaction number, date."""
+
+_TRANSACTION_VALUE_STRUCTS: Dict[int, struct.Struct] = {
+    data_type_code: data_type.structure for data_type_code, data_type in TransactionDataTypeDict.items()
+}
+"""Opcode 206 command 2 value Struct by transaction data type code."""
+
 class TransactionHistoryRequestData(RequestData):
 
     opcode: int = 206
@@ -1611,13 +1666,11 @@ class TransactionHistoryRequestData(RequestData):
             ) and (
                 self.transaction_offset is not None
             ):
-                data: bytes = struct.pack(
-                    'BB',
+                return _S_TRANSACTION_LIST_REQUEST.pack(
                     self.command.value,
-                    self.transaction_segment
+                    self.transaction_segment,
+                    self.transaction_offset
                 )
-                data += struct.pack('<h', self.transaction_offset)
-                return data
             else:
                 raise TypeError('If requesting transaction list, must include segment and transaction offset arguments.')
         elif self.command == TransactionHistoryRequestCommand.READ_TRANSACTION:
@@ -1628,14 +1681,12 @@ class TransactionHistoryRequestData(RequestData):
             ) and (
                 self.data_offset is not None
             ):
-                data: bytes = struct.pack(
-                    'BB',
+                return _S_READ_TRANSACTION_REQUEST.pack(
                     self.command.value,
-                    self.transaction_segment
+                    self.transaction_segment,
+                    self.transaction_number,
+                    self.data_offset
                 )
-                data += struct.pack('<h', self.transaction_number)
-                data += struct.pack('<h', self.data_offset)
-                return data
             else:
                 raise TypeError('If requesting transaction list, must include segment, transaction number, and data offset arguments.')
         else:
@@ -1680,31 +1731,31 @@ class TransactionHistoryResponseData(ResponseData[TransactionHistoryData]):
     data: Optional[TransactionHistoryData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> TransactionHistoryData:
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> TransactionHistoryData:
         
         # Parse response for parameter count and value data
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
+        data_length: int = raw_response[5]
+        response_data: memoryview = memoryview(raw_response)[6:6 + data_length]
 
         command = TransactionHistoryRequestCommand(response_data[0])
         if command == TransactionHistoryRequestCommand.LIST_TRANSACTIONS:
-            number_of_transactions: int = response_data[1]
-            excess_transactions: bool = bool(response_data[2])
-            description: str = struct.unpack('10s', response_data[3:13])[0]
-            payload_size: int = struct.unpack('<h', response_data[13:15])[0]
+            (
+                number_of_transactions,
+                excess_transactions_flag,
+                description_bytes,
+                payload_size
+            ) = _S_TRANSACTION_LIST_HEADER.unpack_from(response_data, 1)
+            excess_transactions: bool = excess_transactions_flag != 0
+            description: str = description_bytes.decode()
             
-            # Decode transactions
-            transaction_bytes: bytes = response_data[15:]
-            transactions: list[tuple[int, datetime]] = []
-            curr_idx: int = 0
-            for i in range(number_of_transactions):
-                transaction_number: int = struct.unpack('<h', transaction_bytes[curr_idx:curr_idx + 2])[0] # 2 bytes for transaction number
-                time_int: int = struct.unpack('<I', transaction_bytes[curr_idx + 2:curr_idx + 6])[0] # 4 bytes for date
-                timestamp: datetime = datetime.fromtimestamp(time_int)
-                transactions.append((transaction_number, timestamp))
-                curr_idx += 6 # increment by 6 number/date bytes
+            # Decode transactions (2-byte number + 4-byte date each); transaction data starts at byte 15
+            transaction_bytes: memoryview = response_data[15:15 + _S_TRANSACTION.size * number_of_transactions]
+            transactions: list[tuple[int, datetime]] = [
+                (transaction_number, datetime.fromtimestamp(time_int))
+                for transaction_number, time_int in _S_TRANSACTION.iter_unpack(transaction_bytes)
+            ]
             
-            return TransactionHistoryData(
+            return TransactionHistoryData.model_construct(
                 command=command,
                 number_of_transactions=number_of_transactions,
                 excess_transactions=excess_transactions,
@@ -1715,26 +1766,20 @@ class TransactionHistoryResponseData(ResponseData[TransactionHistoryData]):
 
         elif command == TransactionHistoryRequestCommand.READ_TRANSACTION:
             message_data_size: int = response_data[1]
-            excess_data: bool = bool(response_data[2])
+            excess_data: int = int(response_data[2] != 0) # 0/1 flag, as the validated model coerced it
             
-            # Decode values
+            # Decode values; each is a data type code byte followed by the value
             values: list[Any] = []
             value_bytes_size: int = message_data_size - 1 # 1 byte for the excess data flag
-            value_bytes: bytes = response_data[3:value_bytes_size]
+            value_bytes: memoryview = response_data[3:3 + value_bytes_size]
+            value_bytes_end: int = len(value_bytes)
             curr_idx: int = 0
-            while curr_idx < len(value_bytes):
-                data_type: int = value_bytes[curr_idx]
-                data_type_class: ROCDataType = TransactionDataTypeDict[data_type]
-                value_start_idx: int = curr_idx + 1
-                value_end_idx: int = value_start_idx + data_type_class.structure.size
-                value: Any = struct.unpack(
-                    data_type_class.structure.format, 
-                    value_bytes[value_start_idx:value_end_idx]
-                )
-                values.append(value)
-                curr_idx += 1 + data_type_class.structure.size
+            while curr_idx < value_bytes_end:
+                structure: struct.Struct = _TRANSACTION_VALUE_STRUCTS[value_bytes[curr_idx]]
+                values.append(structure.unpack_from(value_bytes, curr_idx + 1))
+                curr_idx += 1 + structure.size
 
-            return TransactionHistoryData(
+            return TransactionHistoryData.model_construct(
                 command=command,
                 message_data_size=message_data_size,
                 excess_data=excess_data,
@@ -1746,7 +1791,11 @@ class TransactionHistoryResponseData(ResponseData[TransactionHistoryData]):
 
 """Opcode 255: Error Indicator"""
 
-class OpcodeError(BaseModel):
+_S_ERROR_PAIR = struct.Struct('BB')
+"""Opcode 255 error entry: error code, offset of the byte that caused the error."""
+
+@dataclass(slots=True, frozen=True)
+class OpcodeError:
     """
     Opcode 255 Error Instance.
     """
@@ -1766,22 +1815,21 @@ class OpcodeErrorResponseData(ResponseData[OpcodeErrorData]):
     data: Optional[OpcodeErrorData] = None
 
     @classmethod
-    def data_from_binary(cls, raw_response: bytes, request_data: RequestData) -> OpcodeErrorData:
-        data_length: int = int(raw_response[5])
-        response_data: bytes = raw_response[6:6 + data_length]
-        errors: List[OpcodeError] = []
-        for error_code, cause_byte_offset in zip(response_data[::2], response_data[1::2]):
-            error_code_obj: OpcodeErrorCode = OpcodeErrorCodes.get_error_code(error_code)
-            errors.append(OpcodeError(
-                error_code=error_code_obj,
-                cause_byte_offset=cause_byte_offset
-            ))
+    def data_from_binary(cls, raw_response: bytes, request_data: RequestData, response_timestamp: Optional[datetime] = None) -> OpcodeErrorData:
+        data_length: int = raw_response[5]
+        number_of_errors: int = data_length // 2
+        error_data: memoryview = memoryview(raw_response)[6:6 + _S_ERROR_PAIR.size * number_of_errors]
+        errors: List[OpcodeError] = [
+            OpcodeError(OpcodeErrorCodes.get_error_code(error_code), cause_byte_offset)
+            for error_code, cause_byte_offset in _S_ERROR_PAIR.iter_unpack(error_data)
+        ]
         return OpcodeErrorData(errors=errors)
 
 class MessageModels:
 
     _6 = MessageModel(request_data=SystemConfigRequestData, response_data=SystemConfigResponseData, opcode_desc='System Configuration')
     _7 = MessageModel(request_data=ReadClockRequestData, response_data=ReadClockResponseData, opcode_desc='Read Real-time Clock')
+    _10 = MessageModel(request_data=OpcodeTableRequestData, response_data=OpcodeTableResponseData, opcode_desc='Read Configurable Opcode Point Data')
     _50 = MessageModel(request_data=IOLocationRequestData, response_data=IOLocationResponseData, opcode_desc='Request I/O Point Position')
     _105 = MessageModel(
         request_data=TodayYestMinMaxRequestData, 
@@ -1837,14 +1885,14 @@ class MessageModels:
     )
     _255 = MessageModel(request_data=RequestData, response_data=OpcodeErrorResponseData, opcode_desc='Error Indicator')
 
+    _BY_OPCODE: Dict[int, MessageModel] = {
+        int(k[1:]): v for k, v in list(locals().items()) if isinstance(v, MessageModel)
+    }
+    """Opcode models indexed by opcode number."""
+
     @classmethod
     def get_model_by_opcode(cls, opcode: int) -> MessageModel:
-        model: Optional[MessageModel] = None
-        query_string = '_' + str(opcode)
-        for k, v in cls.__dict__.items():
-            if k == query_string:
-                model = v
-        if model is None:
-            raise KeyError(f'No Opcode model found for opcode {opcode}.')
-        else:
-            return model
\ No newline at end of file
+        try:
+            return cls._BY_OPCODE[opcode]
+        except KeyError:
+            raise KeyError(f'No Opcode model found for opcode {opcode}.')
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, field_serializer, SerializationInfo, ConfigDict, Field
 from typing import Type, Dict
+from functools import cached_property
 import struct
 
 
@@ -16,10 +17,21 @@ class ROCDataType(BaseModel):
     """Corresponding Python base type for the ROC Data Type."""
 
 
-    @property
+    @cached_property
     def structure(self) -> struct.Struct:
+        """Compiled little-endian Struct for this data type. Built once per instance and reused."""
         return struct.Struct(f'<{self.format_string}')
 
+    @cached_property
+    def item_count(self) -> int:
+        """Number of values unpacking this data type yields (e.g. 1 for FLOAT, 3 for TLP, 0 for UNKNOWN)."""
+        return len(self.structure.unpack(bytes(self.structure.size)))
+
+    @cached_property
+    def is_scalar(self) -> bool:
+        """True if unpacking this data type yields exactly one value (False for e.g. TLP, which yields three)."""
+        return self.item_count == 1
+
     @field_serializer('py_type', when_used='always')
     def serialize_py_type(self, py_type: Type, info: SerializationInfo) -> str:
         return str(py_type.__name__)
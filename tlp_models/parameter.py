@@ -22,6 +22,11 @@ class Parameter(BaseModel):
     value_range: tuple[str | int | float] | str
     """Valid range of values for parameter."""
 
+    @property
+    def is_scalar(self) -> bool:
+        """True if the parameter's data type unpacks to a single value rather than a list."""
+        return self.data_type.is_scalar
+
     @field_validator('data_type')
     def validate_data_type(cls, v, info: ValidationInfo) -> ROCDataType:
         if not isinstance(v, ROCDataType):
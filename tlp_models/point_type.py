@@ -1,5 +1,5 @@
 from tlp_models.parameter import Parameter
-from typing import Optional, Type, ClassVar
+from typing import Dict, Optional, Type, ClassVar, Tuple
 from abc import ABC
 
 class ParameterNotFoundError(KeyError):
@@ -15,31 +15,53 @@ class PointType(ABC):
 
     Parameters: ClassVar[Type]
 
+    _PARAMS: ClassVar[Tuple[Parameter, ...]] = ()
+    """Parameter definitions in declaration order. Built once per subclass."""
+
+    _PARAM_MAP: ClassVar[Dict[int, Parameter]] = {}
+    """Parameter definitions indexed by parameter number. Built once per subclass."""
+
+    _PARAM_NAME_MAP: ClassVar[Dict[str, Parameter]] = {}
+    """Parameter definitions indexed by lower-cased attribute name. Built once per subclass."""
+
+    _POINT_TYPE_BY_PARAMETER_CLASS: ClassVar[Dict[Type[Parameter], Type['PointType']]] = {}
+    """Point type owning each point-type-specific Parameter subclass. Shared across all subclasses."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        params: list[Parameter] = []
+        param_map: Dict[int, Parameter] = {}
+        param_name_map: Dict[str, Parameter] = {}
+        parameters: Optional[Type] = getattr(cls, 'Parameters', None)
+        if parameters is not None:
+            for k, v in parameters.__dict__.items():
+                if isinstance(v, Parameter):
+                    params.append(v)
+                    param_map.setdefault(v.parameter_number, v)
+                    param_name_map.setdefault(k.lower(), v)
+                    if type(v).__qualname__.split('.')[0] == cls.__name__:
+                        PointType._POINT_TYPE_BY_PARAMETER_CLASS.setdefault(type(v), cls)
+        cls._PARAMS = tuple(params)
+        cls._PARAM_MAP = param_map
+        cls._PARAM_NAME_MAP = param_name_map
+
     @classmethod
     def get_all_parameters(cls) -> list[Parameter]:
         """Get all TLPParameter objects as a list."""
-        return [v for v in cls.Parameters.__dict__.values() if isinstance(v, Parameter)]
+        return list(cls._PARAMS)
 
 
     @classmethod
     def get_parameter_by_number(cls, parameter_number: int) -> Parameter:
-        parameter: Optional[Parameter] = None
-        for v in cls.Parameters.__dict__.values():
-            if isinstance(v, Parameter):
-                if v.parameter_number == parameter_number:
-                    parameter = v
-                    return parameter
-        if parameter is None:
+        try:
+            return cls._PARAM_MAP[parameter_number]
+        except KeyError:
             raise ParameterNotFoundError(f'No parameter found for parameter number {parameter_number}.')
         
 
     @classmethod
     def get_parameter_by_name(cls, parameter_name: str) -> Parameter:
-        parameter: Optional[Parameter] = None
-        for k, v in cls.Parameters.__dict__.items():
-            if isinstance(v, Parameter):
-                if k.lower() == parameter_name.lower():
-                    parameter = v
-                    return parameter
-        if parameter is None:
+        try:
+            return cls._PARAM_NAME_MAP[parameter_name.lower()]
+        except KeyError:
             raise ParameterNotFoundError(f'No parameter found for name {parameter_name}.')
\ No newline at end of file
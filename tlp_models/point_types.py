@@ -1,4 +1,4 @@
-from typing import List, Type, Optional
+from typing import ClassVar, Dict, List, Type, Optional
 from .point_type import PointType
 from .roc_plus_point_types import *
 
@@ -75,6 +75,11 @@ class PointTypes:
     IEC62591_LIVE_LIST = IEC62591_LIVE_LIST
     IEC62591_COMMISSIONED_LIST = IEC62591_COMMISSIONED_LIST
 
+    _PT_MAP: ClassVar[Dict[int, Type[PointType]]] = {
+        v.point_type_number: v for v in list(locals().values()) if isinstance(v, type) and issubclass(v, PointType)
+    }
+    """Point type classes indexed by point type number."""
+
     @classmethod
     def get_all_point_types(cls) -> List[Type[PointType]]:
         point_types: List[Type[PointType]] = []
@@ -86,16 +91,10 @@ class PointTypes:
 
     @classmethod
     def get_point_type_by_number(cls, point_type: int) -> Type[PointType]:
-        point_type_cls: Optional[Type[PointType]] = None
-        for k, v in cls.__dict__.items():
-            if isinstance(v, type):
-                if issubclass(v, PointType):
-                    if v.point_type_number == point_type:
-                        point_type_cls = v
-        if point_type_cls is None:
+        try:
+            return cls._PT_MAP[point_type]
+        except KeyError:
             raise PointTypeNotFoundError(f'No point type found for point type number {point_type}.')
-        else:
-            return point_type_cls
 
     @classmethod
     def get_point_type_by_name(cls, point_type_name: str) -> Type[PointType]:
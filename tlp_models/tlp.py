@@ -1,12 +1,50 @@
-from pydantic import BaseModel, field_validator, ValidationInfo, field_serializer, SerializationInfo, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo, field_serializer, SerializationInfo, model_validator
 from datetime import datetime
+from functools import lru_cache
 from typing import Type, Any, Optional, List, Dict, overload
 from roc_data_types import ParameterDataTypes, ROCDataType
 from tlp_models.parameter import Parameter
 from tlp_models.point_type import PointType
 from tlp_models.point_types import PointTypeNotFoundError, PointTypes
 
+_BIN_BITS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple((v >> i) & 1 == 1 for i in range(8)) for v in range(256) # Go from LSB to MSB so it matches the parameter spec
+)
+"""Bit values of every possible BIN value, indexed by value."""
+
+
+@lru_cache(maxsize=4096)
+def _resolve_definitions(point_type: int, parameter: int) -> tuple[Type[PointType], Parameter]:
+    """Point type class and parameter definition for a raw (point type, parameter) pair, cached across calls."""
+    point_type_obj: Type[PointType] = PointTypes.get_point_type_by_number(point_type)
+    return point_type_obj, point_type_obj.get_parameter_by_number(parameter)
+
+
+@lru_cache(maxsize=256)
+def _unknown_point_type(point_type: int) -> Type[PointType]:
+    """Placeholder PointType subclass for a point type number missing from PointTypes, created once per number."""
+
+    class UNKNOWN_POINT_TYPE(PointType):
+        point_type_number: int = point_type
+        point_type_desc: str = 'Unknown Point Type'
+
+    return UNKNOWN_POINT_TYPE
+
+
+@lru_cache(maxsize=256)
+def _unknown_parameter(parameter: int) -> Parameter:
+    """Placeholder parameter definition for a parameter of an unknown point type, created once per number."""
+    return Parameter(
+        parameter_name='Unknown Parameter',
+        parameter_desc='Unknown Parameter',
+        parameter_number=parameter,
+        access='Unknown',
+        data_type=ParameterDataTypes.UNKNOWN,
+        value_range=('')
+    )
+
 class TLPInstance(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     parameter: Parameter
     """Parameter definition for the TLP."""
@@ -65,8 +103,10 @@ class TLPInstance(BaseModel):
         if isinstance(values, dict):
             if 'point_type' not in values:
                 parameter: Parameter = values['parameter']
-                point_type_name: str = parameter.__class__.__qualname__.split('.')[0]
-                point_type: PointType = getattr(PointTypes, point_type_name)
+                point_type: Optional[Type[PointType]] = PointType._POINT_TYPE_BY_PARAMETER_CLASS.get(type(parameter))
+                if point_type is None:
+                    point_type_name: str = parameter.__class__.__qualname__.split('.')[0]
+                    point_type = getattr(PointTypes, point_type_name)
                 values['point_type'] = point_type
             return values
         else:
@@ -75,8 +115,14 @@ class TLPInstance(BaseModel):
     @classmethod
     def from_integers(cls, point_type: int, logical_number: int, parameter: int) -> 'TLPInstance':
         try:
-            point_type_obj: Type[PointType] = PointTypes.get_point_type_by_number(point_type)
-            parameter_obj: Parameter = point_type_obj.get_parameter_by_number(parameter)
+            point_type_obj, parameter_obj = _resolve_definitions(point_type, parameter)
+            if isinstance(logical_number, int) and 0 <= logical_number <= 255:
+                # Definitions come from the PointTypes lookup, so only the logical number needs checking
+                return cls.from_integers_fast(
+                    point_type=point_type_obj,
+                    logical_number=logical_number,
+                    parameter=parameter_obj
+                )
             return TLPInstance(
                 parameter=parameter_obj,
                 point_type=point_type_obj,
@@ -90,24 +136,29 @@ class TLPInstance(BaseModel):
             )
 
     @classmethod
-    def get_unknown_tlp(cls, point_type: int, logical_number: int, parameter: int) -> 'TLPInstance':
-        
-        class UNKNOWN_POINT_TYPE(PointType):
-                point_type_number: int = point_type
-                point_type_desc: str = 'Unknown Point Type'
-            
-        UNKNOWN_PARAMETER = Parameter(
-            parameter_name='Unknown Parameter',
-            parameter_desc='Unknown Parameter',
-            parameter_number=parameter,
-            access='Unknown',
-            data_type=ParameterDataTypes.UNKNOWN,
-            value_range=('')
+    def from_integers_fast(cls, point_type: Type[PointType], logical_number: int, parameter: Parameter) -> 'TLPInstance':
+        """
+        Create a TLPInstance from an already-resolved point type and parameter definition without model validation.
+
+        Args:
+            point_type (Type[PointType]): Point type definition.
+            logical_number (int): Logical number of the TLP (0-255, not checked).
+            parameter (Parameter): Parameter definition.
+
+        Returns:
+            TLPInstance: Constructed TLPInstance.
+        """
+        return cls.model_construct(
+            parameter=parameter,
+            point_type=point_type,
+            logical_number=logical_number
         )
 
+    @classmethod
+    def get_unknown_tlp(cls, point_type: int, logical_number: int, parameter: int) -> 'TLPInstance':
         return TLPInstance(
-            parameter=UNKNOWN_PARAMETER, 
-            point_type=UNKNOWN_POINT_TYPE, 
+            parameter=_unknown_parameter(parameter), 
+            point_type=_unknown_point_type(point_type), 
             logical_number=logical_number
         )
 
@@ -116,52 +167,43 @@ class TLPValue(TLPInstance):
     value: Any
     """Value of this TLP."""
 
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     """Timestamp of the current value."""
 
     bit_values: List[bool] = []
     """If data type is BIN, values for each bit within the binary value indexed by bit number."""
 
-    @field_validator('value', mode='before')
-    @classmethod
-    def validate_value(cls, v, info: ValidationInfo) -> Any:
-        param_def: Optional[Parameter] = info.data.get('parameter')
-        if isinstance(param_def, Parameter):
-            data_type: Type[Any] = param_def.data_type.py_type
-            if data_type == str:
-                if isinstance(v, bytes):
-                    try:
-                        v_str: str = v.decode('utf-8')
-                        return v_str.strip()
-                    except:
-                        raise ValueError(f'Unable to parse value {v} to string.')
-            elif isinstance(v, data_type):
-                return v
-            else:
-                raise ValueError(f'Value was not of expected type {data_type}.')
+    @staticmethod
+    def _convert_value(param_def: Parameter, v: Any) -> Any:
+        """Check/convert a raw value against the parameter's Python type (bytes are decoded and stripped for strings)."""
+        data_type: Type[Any] = param_def.data_type.py_type
+        if data_type == str:
+            if isinstance(v, bytes):
+                try:
+                    v_str: str = v.decode('utf-8')
+                    return v_str.strip()
+                except:
+                    raise ValueError(f'Unable to parse value {v} to string.')
+        elif isinstance(v, data_type):
+            return v
         else:
-            raise ValueError(f'Parameter definition of unexpected type: {type(param_def)}.')
+            raise ValueError(f'Value was not of expected type {data_type}.')
 
 
     @model_validator(mode='before')
-    def set_bit_values(cls, values) -> Dict:
+    def validate_value(cls, values) -> Dict:
+        """Convert the raw value against the parameter definition and, for BIN parameters, set the bit values."""
         if isinstance(values, dict):
             parameter_def: Parameter | None = values.get('parameter')
             if parameter_def is None:
                 raise ValueError('Parameter definition not provided.')
             elif isinstance(parameter_def, Parameter):
-                data_type: ROCDataType = parameter_def.data_type
-                if data_type == ParameterDataTypes.BIN:
-                    raw_value: Any | None = values.get('value')
-                    if isinstance(raw_value, int) and 0 <= raw_value <= 255:
-                        bit_values: List[bool] = [(raw_value >> i) & 1 == 1 for i in range(8)] # Go from LSB to MSB so it matches the parameter spec
-                        values['value'] = raw_value
-                        values['bit_values'] = bit_values
-                        return values
-                    else:
-                        return values
-                else:
-                    return values
+                if 'value' in values:
+                    value: Any = cls._convert_value(parameter_def, values['value'])
+                    values['value'] = value
+                    if parameter_def.data_type == ParameterDataTypes.BIN and isinstance(value, int) and 0 <= value <= 255:
+                        values['bit_values'] = list(_BIN_BITS[value])
+                return values
             else:
                 raise ValueError('Invalid Parameter definition provided.')
         else:
@@ -186,6 +228,89 @@ class TLPValue(TLPInstance):
             bit_values=bit_values
         )
 
+    @classmethod
+    def from_tlp_instance_batch(
+        cls,
+        tlp: TLPInstance,
+        items: List[tuple[Any, datetime | None]]
+    ) -> List['TLPValue']:
+        """
+        Create TLPValue objects for several values of the same TLP.
+
+        The TLP's parameter definition is resolved once for the whole batch and each value goes through the same
+            type conversion as the validated constructor, so the per-value model validation can be skipped.
+
+        Args:
+            tlp (TLPInstance): TLP that all values belong to.
+            items (List[tuple[Any, datetime | None]]): (value, timestamp) pairs. A timestamp of None means "now".
+
+        Returns:
+            List[TLPValue]: One TLPValue per item, in order.
+        """
+        now: datetime = datetime.now()
+        return [
+            cls.from_raw_fast(
+                point_type=tlp.point_type,
+                logical_number=tlp.logical_number,
+                parameter=tlp.parameter,
+                value=value,
+                timestamp=timestamp if timestamp is not None else now
+            )
+            for value, timestamp in items
+        ]
+
+    @classmethod
+    def from_raw_fast(
+        cls,
+        point_type: Type[PointType],
+        logical_number: int,
+        parameter: Parameter,
+        value: Any,
+        timestamp: datetime
+    ) -> 'TLPValue':
+        """
+        Create a TLPValue from an already-resolved point type and parameter definition without model validation.
+
+        Intended for decoders working on trusted definitions (e.g. from PointTypes lookups). The value goes through
+            the same type conversion and BIN bit expansion as the validated constructor.
+
+        Args:
+            point_type (Type[PointType]): Point type definition.
+            logical_number (int): Logical number of the TLP.
+            parameter (Parameter): Parameter definition.
+            value (Any): Raw decoded value.
+            timestamp (datetime): Timestamp of the value.
+
+        Returns:
+            TLPValue: Constructed TLPValue.
+
+        Raises:
+            ValidationError: If the value does not convert, as with the validated constructor.
+        """
+        try:
+            converted_value: Any = cls._convert_value(parameter, value)
+        except ValueError:
+            # Re-run through the validated constructor so the failure surfaces as a ValidationError
+            return cls(
+                parameter=parameter,
+                point_type=point_type,
+                logical_number=logical_number,
+                value=value,
+                timestamp=timestamp
+            )
+        value = converted_value
+        bit_values: List[bool] = []
+        if parameter.data_type == ParameterDataTypes.BIN and isinstance(value, int) and 0 <= value <= 255:
+            bit_values = list(_BIN_BITS[value])
+        return cls.model_construct(
+            parameter=parameter,
+            point_type=point_type,
+            logical_number=logical_number,
+            value=value,
+            timestamp=timestamp,
+            bit_values=bit_values
+        )
+
 class TLPValues(BaseModel):
     """
     Collection of TLPValue objects for ease of serialization.
@@ -194,5 +319,9 @@ class TLPValues(BaseModel):
     values: List[TLPValue]
     """List of TLP Values."""
 
-    timestamp: datetime = datetime.now()
-    """Timestamp of object creation. For streaming messages, indicates when all tag reads completed."""
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.now)
+    """Timestamp of object creation. For streaming messages, indicates when all tag reads completed."""
+
+    def to_json(self, **kwargs) -> str:
+        kwargs['indent'] = 4
+        return self.model_dump_json(**kwargs)